@@ -4,9 +4,10 @@ from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from pydantic import ValidationError
 from scalar_fastapi import Layout, SearchHotKey, get_scalar_api_reference
 
-from .exceptions import APIError
+from .exceptions import APIError, ErrorCodes
 
 
 def create_app() -> FastAPI:
@@ -48,6 +49,25 @@ def create_app() -> FastAPI:
             content={"detail": exc.errors()},
         )
 
+    # Exception handler for artifact validation errors raised by services
+    @app.exception_handler(ValidationError)
+    async def artifact_validation_error_handler(_request: Request, exc: ValidationError):
+        """Format Pydantic validation errors once at the API boundary."""
+        return JSONResponse(
+            status_code=422,
+            content={
+                "error": {
+                    "code": ErrorCodes.ARTIFACT_INVALID,
+                    "message": f"Invalid {exc.title}",
+                    "details": {
+                        "errors": exc.errors(
+                            include_url=False, include_context=False, include_input=False
+                        )
+                    },
+                }
+            },
+        )
+
     # Custom exception handler for APIError to return {"error": {...}} format
     @app.exception_handler(APIError)
     async def api_error_handler(_request: Request, exc: APIError):
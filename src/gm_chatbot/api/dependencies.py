@@ -124,6 +124,13 @@ def get_discord_context_service() -> DiscordContextService:
     return _discord_context_service
 
 
+def close_dependencies():
+    """Close the shared artifact store and reset all global dependencies."""
+    if _store is not None:
+        _store.close()
+    reset_dependencies()
+
+
 def reset_dependencies():
     """Reset all global dependencies (for testing only)."""
     global _store, _campaign_service, _character_service, _game_state_service
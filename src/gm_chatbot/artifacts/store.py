@@ -1,15 +1,36 @@
 """Artifact store for YAML persistence."""
 
+import asyncio
 import fcntl
+import json
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import IO, Any, TypeVar
 
+import yaml
+
+from ..lib.yaml import SafeLoader
 from ..models.base import BaseArtifact
 
+T = TypeVar("T")
+
 
 class ArtifactStore:
     """Manages YAML artifact persistence with atomic writes and file locking."""
 
+    # Number of event log lines kept before folding them into the snapshot
+    EVENT_LOG_COMPACT_THRESHOLD = 100
+
+    # Worker threads shared by every service using this store for async reads
+    IO_POOL_SIZE = 8
+
+    # Recently read artifact files kept in memory and revalidated by stat
+    READ_CACHE_MAXSIZE = 256
+
     def __init__(
         self,
         campaigns_dir: Path | str | None = None,
@@ -41,6 +62,14 @@ class ArtifactStore:
                 players_dir = os.getenv("PLAYERS_DIR", "/data/players")
         self.players_dir = Path(players_dir)
         self.players_dir.mkdir(parents=True, exist_ok=True)
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=self.IO_POOL_SIZE, thread_name_prefix="artifact-io"
+        )
+        # path -> (stat key, contents, written by this store)
+        self._read_cache: OrderedDict[Path, tuple[tuple[int, int, int], str, bool]] = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        # event log path -> (inode, size, line count) as of this store's last append
+        self._event_log_lines: dict[Path, tuple[int, int, int]] = {}
 
     def get_campaign_dir(self, campaign_id: str) -> Path:
         """
@@ -83,11 +112,15 @@ class ArtifactStore:
 
         # Atomic write: write to temp file, then rename
         temp_path = file_path.with_suffix(".tmp")
+        content = artifact.to_yaml()
         try:
             with temp_path.open("w") as f:
                 fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                f.write(artifact.to_yaml())
+                f.write(content)
                 f.flush()
+                # The rename keeps inode, mtime and size, so this stat
+                # identifies the file we are about to publish
+                stat = os.fstat(f.fileno())
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
             temp_path.replace(file_path)
         except Exception:
@@ -95,6 +128,8 @@ class ArtifactStore:
                 temp_path.unlink()
             raise
 
+        self._cache_contents(file_path, stat, content, trusted=True)
+        artifact._source_key = self._stat_key(stat)
         return file_path
 
     def load_artifact(
@@ -106,6 +141,9 @@ class ArtifactStore:
         """
         Load an artifact from YAML file.
 
+        Files still unchanged since this store saved them are rebuilt
+        without re-validation; anything else is fully validated.
+
         Args:
             artifact_class: Class of artifact to load
             campaign_id: Campaign identifier
@@ -118,8 +156,127 @@ class ArtifactStore:
             FileNotFoundError: If artifact file not found
         """
         file_path = self.get_campaign_dir(campaign_id) / filename
-        if not file_path.exists():
-            raise FileNotFoundError(f"Artifact not found: {file_path}")
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Artifact not found: {file_path}") from None
+
+        content, trusted = self._read_cached_entry(file_path, stat)
+        if trusted:
+            artifact = artifact_class.from_yaml_trusted(content)
+        else:
+            artifact = artifact_class.from_yaml(content)
+        artifact._source_key = self._stat_key(stat)
+        return artifact
+
+    def load_raw(self, campaign_id: str, filename: str) -> Any:
+        """
+        Load an artifact's YAML data without model validation.
+
+        The result is whatever the file parses to; callers expecting a
+        mapping must check for one.
+
+        Args:
+            campaign_id: Campaign identifier
+            filename: Filename of artifact
+
+        Returns:
+            Parsed YAML data (an empty mapping if the file is empty)
+
+        Raises:
+            FileNotFoundError: If artifact file not found
+        """
+        file_path = self.get_campaign_dir(campaign_id) / filename
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Artifact not found: {file_path}") from None
+
+        return yaml.load(self._read_cached(file_path, stat), Loader=SafeLoader) or {}
+
+    async def load_artifact_async(
+        self,
+        artifact_class: type[BaseArtifact],
+        campaign_id: str,
+        filename: str,
+    ) -> BaseArtifact:
+        """
+        Load an artifact on the store's I/O pool without blocking the event loop.
+
+        Args:
+            artifact_class: Class of artifact to load
+            campaign_id: Campaign identifier
+            filename: Filename of artifact
+
+        Returns:
+            Loaded artifact instance
+
+        Raises:
+            FileNotFoundError: If artifact file not found
+        """
+        return await self.run_io(self.load_artifact, artifact_class, campaign_id, filename)
+
+    def close(self) -> None:
+        """
+        Shut down the store's I/O pool.
+
+        Waits for in-flight reads and writes to finish. Safe to call more
+        than once; run_io fails once the store is closed.
+        """
+        self._io_pool.shutdown(wait=True)
+
+    async def run_io(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking storage function on the store's I/O pool.
+
+        Args:
+            func: Blocking function to run
+            *args: Positional arguments for func
+
+        Returns:
+            Result of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, func, *args)
+
+    @staticmethod
+    def _stat_key(stat: os.stat_result) -> tuple[int, int, int]:
+        """Identify a file's contents by inode, mtime and size."""
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _read_cached(self, file_path: Path, stat: os.stat_result) -> str:
+        """
+        Read a file, reusing the cached contents while its stat is unchanged.
+
+        Args:
+            file_path: Path to read
+            stat: Current stat of file_path
+
+        Returns:
+            File contents
+        """
+        return self._read_cached_entry(file_path, stat)[0]
+
+    def _read_cached_entry(self, file_path: Path, stat: os.stat_result) -> tuple[str, bool]:
+        """
+        Read a file, reusing the cached contents while its stat is unchanged.
+
+        Atomic writes replace the file, so a new inode or mtime always
+        invalidates the cached copy.
+
+        Args:
+            file_path: Path to read
+            stat: Current stat of file_path
+
+        Returns:
+            (file contents, whether this store wrote exactly these contents)
+        """
+        key = self._stat_key(stat)
+        with self._read_cache_lock:
+            cached = self._read_cache.get(file_path)
+            if cached is not None and cached[0] == key:
+                self._read_cache.move_to_end(file_path)
+                return cached[1], cached[2]
 
         with file_path.open() as f:
             fcntl.flock(f.fileno(), fcntl.LOCK_SH)
@@ -128,7 +285,304 @@ class ArtifactStore:
             finally:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
-        return artifact_class.from_yaml(content)
+        self._cache_contents(file_path, stat, content, trusted=False)
+        return content, False
+
+    def _cache_contents(
+        self, file_path: Path, stat: os.stat_result, content: str, trusted: bool
+    ) -> None:
+        """
+        Store a file's contents in the read cache.
+
+        Args:
+            file_path: Path the contents belong to
+            stat: Stat of file_path matching content
+            content: File contents
+            trusted: Whether this store wrote content itself
+        """
+        key = self._stat_key(stat)
+        with self._read_cache_lock:
+            self._read_cache[file_path] = (key, content, trusted)
+            self._read_cache.move_to_end(file_path)
+            if len(self._read_cache) > self.READ_CACHE_MAXSIZE:
+                self._read_cache.popitem(last=False)
+
+    def append_event(
+        self,
+        campaign_id: str,
+        artifact_name: str,
+        event: dict[str, Any],
+    ) -> None:
+        """
+        Append an event to an artifact's append-only log.
+
+        Events are written as JSON lines to ``{artifact_name}.log``. Once the
+        log grows past EVENT_LOG_COMPACT_THRESHOLD lines its events are
+        appended to ``{artifact_name}.snapshot.jsonl`` and the log is
+        replaced with an empty one, so neither an append nor a compaction
+        rewrites the history. Each compaction ends with a marker line naming
+        the log file and size it folded; a crash before the log is replaced
+        therefore cannot replay those events twice, and a compaction cut
+        short before its marker is ignored and redone.
+
+        Args:
+            campaign_id: Campaign identifier
+            artifact_name: Artifact path relative to the campaign (e.g., "state/history")
+            event: JSON-serializable event data
+        """
+        base_path = self.get_campaign_dir(campaign_id) / artifact_name
+        base_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path = base_path.with_name(f"{base_path.name}.log")
+
+        with self._open_event_log(log_path, "a+", fcntl.LOCK_EX) as f:
+            try:
+                fd = f.fileno()
+                stat = os.fstat(fd)
+                size = stat.st_size
+                if size and os.pread(fd, 1, size - 1) != b"\n":
+                    # A crash cut the last append short; drop the partial line
+                    size = self._last_newline(fd, size) + 1
+                    os.ftruncate(fd, size)
+                f.write(json.dumps(event, separators=(",", ":")) + "\n")
+                f.flush()
+
+                # Count lines incrementally unless another writer touched the log
+                cached = self._event_log_lines.get(log_path)
+                if cached is not None and cached[:2] == (stat.st_ino, size):
+                    line_count = cached[2] + 1
+                else:
+                    f.seek(0)
+                    line_count = sum(1 for line in f if line.strip())
+                size = os.fstat(fd).st_size
+                self._event_log_lines[log_path] = (stat.st_ino, size, line_count)
+
+                if line_count > self.EVENT_LOG_COMPACT_THRESHOLD:
+                    self._compact_event_log(base_path, log_path, f)
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def load_events(self, campaign_id: str, artifact_name: str) -> list[dict[str, Any]]:
+        """
+        Load all events for an artifact (snapshot followed by log replay).
+
+        A trailing line left incomplete by a crash is skipped.
+
+        Args:
+            campaign_id: Campaign identifier
+            artifact_name: Artifact path relative to the campaign (e.g., "state/history")
+
+        Returns:
+            Events in the order they were appended
+        """
+        base_path = self.get_campaign_dir(campaign_id) / artifact_name
+        log_path = base_path.with_name(f"{base_path.name}.log")
+        try:
+            f = self._open_event_log(log_path, "r", fcntl.LOCK_SH)
+        except FileNotFoundError:
+            return self._read_event_snapshots(base_path)[0]
+
+        with f:
+            try:
+                events, folded = self._read_event_snapshots(base_path)
+                fd = f.fileno()
+                offset = 0
+                if folded is not None and folded[0] == os.fstat(fd).st_ino:
+                    # Compaction stopped before replacing this log; skip what it folded
+                    offset = folded[1]
+                events.extend(self._parse_event_lines(self._read_from(fd, offset)))
+                return events
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _open_event_log(log_path: Path, mode: str, operation: int) -> IO[str]:
+        """
+        Open and lock an event log, retrying if compaction replaced it meanwhile.
+
+        Args:
+            log_path: Path to the event log
+            mode: File open mode
+            operation: fcntl lock operation (LOCK_SH or LOCK_EX)
+
+        Returns:
+            Locked file object for the current log file
+        """
+        while True:
+            f = log_path.open(mode)
+            fcntl.flock(f.fileno(), operation)
+            try:
+                if os.fstat(f.fileno()).st_ino == log_path.stat().st_ino:
+                    return f
+            except FileNotFoundError:
+                pass
+            # Locked a log that compaction already swapped out; closing unlocks it
+            f.close()
+
+    def _compact_event_log(self, base_path: Path, log_path: Path, f: IO[str]) -> None:
+        """
+        Append a locked event log's events to the snapshot and start an empty log.
+
+        Only the log's own bytes are written, so the cost does not grow with
+        the history already in the snapshot.
+
+        Args:
+            base_path: Artifact path the log and snapshot are named after
+            log_path: Path to the event log
+            f: Exclusively locked file object for the log
+        """
+        log_fd = f.fileno()
+        log_stat = os.fstat(log_fd)
+        snapshot_path = base_path.with_name(f"{base_path.name}.snapshot.jsonl")
+
+        # Compactions hold the log's exclusive lock, so nothing else writes the snapshot
+        fd = os.open(snapshot_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            end, folded = self._snapshot_tail(fd)
+            if folded is None:
+                folded = self._read_event_snapshot(base_path)[1]
+            offset = 0
+            if folded is not None and folded[0] == log_stat.st_ino:
+                offset = folded[1]
+
+            # Drop any compaction that stopped before its marker, then append
+            os.ftruncate(fd, end)
+            marker = json.dumps([log_stat.st_ino, log_stat.st_size]) + "\n"
+            data = self._read_from(log_fd, offset) + marker.encode()
+            while data:
+                written = os.pwrite(fd, data, end)
+                end += written
+                data = data[written:]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        # The new log gets a fresh inode, so the folded-bytes marker stops applying
+        empty_log_path = log_path.with_suffix(".tmp")
+        empty_log_path.touch()
+        empty_log_path.replace(log_path)
+        self._event_log_lines[log_path] = (log_path.stat().st_ino, 0, 0)
+
+    def _snapshot_tail(self, fd: int) -> tuple[int, tuple[int, int] | None]:
+        """
+        Find where the last complete compaction in a snapshot ends.
+
+        A clean snapshot ends with a marker line, found by reading only the
+        tail; after an interrupted compaction the whole file is scanned.
+
+        Args:
+            fd: Open snapshot file descriptor
+
+        Returns:
+            Offset just past the last marker line, and that marker's
+            (inode, size) of the folded log, or None if there is none
+        """
+        size = os.fstat(fd).st_size
+        if size and os.pread(fd, 1, size - 1) == b"\n":
+            start = self._last_newline(fd, size - 1) + 1
+            last = json.loads(os.pread(fd, size - start, start))
+            if isinstance(last, list):
+                return size, (last[0], last[1])
+
+        end, folded, offset = 0, None, 0
+        for line in self._read_from(fd, 0).splitlines(keepends=True):
+            offset += len(line)
+            if not line.endswith(b"\n"):
+                break
+            if line.startswith(b"["):
+                end, folded = offset, tuple(json.loads(line))
+        return end, folded
+
+    def _read_event_snapshots(
+        self, base_path: Path
+    ) -> tuple[list[dict[str, Any]], tuple[int, int] | None]:
+        """
+        Read every compacted event for an artifact.
+
+        Args:
+            base_path: Artifact path the snapshots are named after
+
+        Returns:
+            The events, and the (inode, size) of the log last folded into
+            them, if recorded
+        """
+        events, folded = self._read_event_snapshot(base_path)
+        snapshot_path = base_path.with_name(f"{base_path.name}.snapshot.jsonl")
+        try:
+            data = snapshot_path.read_bytes()
+        except FileNotFoundError:
+            return events, folded
+
+        pending: list[dict[str, Any]] = []
+        for item in self._parse_event_lines(data):
+            if isinstance(item, list):
+                # Events only count once the compaction that wrote them finished
+                events.extend(pending)
+                pending = []
+                folded = (item[0], item[1])
+            else:
+                pending.append(item)
+        return events, folded
+
+    @staticmethod
+    def _read_event_snapshot(
+        base_path: Path,
+    ) -> tuple[list[dict[str, Any]], tuple[int, int] | None]:
+        """
+        Read events from a single-file ``.snapshot.json`` left by earlier versions.
+
+        Returns:
+            The events, and the (inode, size) of the log they were folded
+            from, if recorded
+        """
+        snapshot_path = base_path.with_name(f"{base_path.name}.snapshot.json")
+        if not snapshot_path.exists():
+            return [], None
+        with snapshot_path.open() as f:
+            snapshot = json.load(f)
+        if isinstance(snapshot, list):
+            return snapshot, None
+        return snapshot["events"], (snapshot["log_inode"], snapshot["log_size"])
+
+    @staticmethod
+    def _parse_event_lines(data: bytes) -> list[Any]:
+        """
+        Parse JSON lines, skipping a final line a crash left without its newline.
+
+        Args:
+            data: Raw JSON lines
+
+        Returns:
+            Parsed values in order
+        """
+        lines = data.split(b"\n")
+        # The last element is empty unless the final line is incomplete
+        return [json.loads(line) for line in lines[:-1] if line.strip()]
+
+    @staticmethod
+    def _read_from(fd: int, offset: int) -> bytes:
+        """Read a file descriptor from offset to its current end."""
+        size = os.fstat(fd).st_size
+        return os.pread(fd, max(size - offset, 0), offset)
+
+    @staticmethod
+    def _last_newline(fd: int, end: int) -> int:
+        """
+        Find the last newline before an offset, reading backwards in blocks.
+
+        Args:
+            fd: Open file descriptor
+            end: Offset to search before
+
+        Returns:
+            Offset of the newline, or -1 if there is none
+        """
+        while end > 0:
+            start = max(end - 4096, 0)
+            index = os.pread(fd, end - start, start).rfind(b"\n")
+            if index != -1:
+                return start + index
+            end = start
+        return -1
 
     def list_artifacts(
         self,
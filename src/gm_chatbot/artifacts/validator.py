@@ -2,8 +2,6 @@
 
 from typing import Any
 
-from pydantic import ValidationError
-
 from ..models.action import GameAction
 from ..models.base import BaseArtifact
 from ..models.campaign import Campaign
@@ -20,10 +18,7 @@ class ArtifactValidator:
         Raises:
             ValidationError: If character data is invalid
         """
-        try:
-            return CharacterSheet.model_validate(data)
-        except ValidationError as e:
-            raise ValidationError(f"Invalid character sheet: {e.errors()}") from e
+        return CharacterSheet.model_validate(data)
 
     def validate_campaign(self, data: dict[str, Any]) -> Campaign:
         """
@@ -32,10 +27,7 @@ class ArtifactValidator:
         Raises:
             ValidationError: If campaign data is invalid
         """
-        try:
-            return Campaign.model_validate(data)
-        except ValidationError as e:
-            raise ValidationError(f"Invalid campaign: {e.errors()}") from e
+        return Campaign.model_validate(data)
 
     def validate_action(self, data: dict[str, Any]) -> GameAction:
         """
@@ -44,23 +36,28 @@ class ArtifactValidator:
         Raises:
             ValidationError: If action data is invalid
         """
-        try:
-            return GameAction.model_validate(data)
-        except ValidationError as e:
-            raise ValidationError(f"Invalid game action: {e.errors()}") from e
+        return GameAction.model_validate(data)
 
-    def validate_artifact(self, artifact: BaseArtifact) -> bool:
+    def validate_artifact(self, artifact: BaseArtifact, deep_validate: bool = False) -> bool:
         """
         Validate an artifact instance.
 
+        Artifacts are validated on construction and on assignment, so an
+        existing instance is trusted unless a full dump/re-parse round trip
+        is explicitly requested.
+
+        Args:
+            artifact: Artifact instance to validate
+            deep_validate: Re-validate the dumped artifact data (slow)
+
         Returns:
             True if valid
 
         Raises:
             ValidationError: If artifact is invalid
         """
-        try:
-            artifact.model_validate(artifact.model_dump())
+        if not deep_validate and isinstance(artifact, BaseArtifact):
             return True
-        except ValidationError as e:
-            raise ValidationError(f"Invalid artifact: {e.errors()}") from e
+
+        artifact.model_validate(artifact.model_dump())
+        return True
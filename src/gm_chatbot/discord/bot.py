@@ -1,8 +1,12 @@
 """Discord bot client."""
 
+import asyncio
 import logging
+from collections import OrderedDict
+from typing import Any
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 
 from ..artifacts.store import ArtifactStore
@@ -13,6 +17,7 @@ from ..services.discord_context_service import DiscordContextService
 from ..services.discord_linking_service import DiscordLinkingService
 from ..services.player_service import PlayerService
 from ..services.session_service import SessionService
+from .commands.base import MAX_CONCURRENT_COMMANDS, build_error_embed
 from .config import DiscordConfig
 
 logger = logging.getLogger(__name__)
@@ -56,24 +61,59 @@ class DiscordBot(commands.Bot):
         self.session_service = SessionService(self.store)
         self.character_service = CharacterService(self.store)
 
+        # Rendered character sheet embeds keyed by (character ID, source file stat key)
+        self.sheet_cache: OrderedDict[tuple[str, tuple[int, int, int]], dict[str, Any]] = (
+            OrderedDict()
+        )
+
+        # Bounds concurrent deferred command handlers; created on this bot's loop
+        self.command_slots: asyncio.Semaphore | None = None
+
+        self.tree.on_error = self.on_app_command_error
+
     async def setup_hook(self) -> None:
         """Called when the bot is starting up."""
         logger.info("Discord bot setup hook called")
-        # Commands will be registered by command modules
-        # This is where we'd sync app commands if needed
+        self.command_slots = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+        # Command modules register their commands before the bot starts, so
+        # the whole tree is synced in one bulk request here. setup_hook runs
+        # once per login, unlike on_ready which fires again on reconnects.
+        try:
+            synced = await self.tree.sync()
+            logger.info("Synced %d command(s)", len(synced))
+        except Exception as e:
+            logger.error("Failed to sync commands: %s", e)
+
+    async def on_app_command_error(
+        self,
+        interaction: discord.Interaction,
+        error: app_commands.AppCommandError,
+    ) -> None:
+        """
+        Handle errors raised before or outside app command handlers.
+
+        Cooldown rejections are answered directly; anything else is logged.
+
+        Args:
+            interaction: Discord interaction
+            error: Error raised by the command tree
+        """
+        if isinstance(error, app_commands.CommandOnCooldown):
+            embed = build_error_embed("Slow Down", f"Try again in {error.retry_after:.1f} seconds.")
+            if interaction.response.is_done():
+                await interaction.followup.send(embed=embed, ephemeral=True)
+            else:
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        command = interaction.command.name if interaction.command else None
+        logger.error("Error in app command %s: %s", command, error, exc_info=error)
 
     async def on_ready(self) -> None:
         """Called when the bot is ready."""
         logger.info(f"Discord bot ready: {self.user} (ID: {self.user.id})")
         logger.info(f"Connected to {len(self.guilds)} guilds")
 
-        # Sync app commands
-        try:
-            synced = await self.tree.sync()
-            logger.info(f"Synced {len(synced)} command(s)")
-        except Exception as e:
-            logger.error(f"Failed to sync commands: {e}")
-
     async def on_guild_join(self, guild: discord.Guild) -> None:
         """Called when the bot joins a guild."""
         logger.info(f"Joined guild: {guild.name} (ID: {guild.id})")
@@ -9,6 +9,20 @@ from ..bot import DiscordBot
 
 logger = logging.getLogger(__name__)
 
+# Static embeds are built from immutable payloads instead of per-call kwargs
+_ADMIN_REQUIRED_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": "You need administrator permissions to use this command.",
+    "color": discord.Color.red().value,
+}
+_SETUP_NOT_IMPLEMENTED_EMBED = {
+    "type": "rich",
+    "title": "Not Implemented",
+    "description": "Admin setup will be implemented in a future update.",
+    "color": discord.Color.orange().value,
+}
+
 
 def setup_admin_commands(bot: DiscordBot) -> None:
     """
@@ -29,19 +43,11 @@ def setup_admin_commands(bot: DiscordBot) -> None:
 
         # Check if user is administrator
         if not interaction.user.guild_permissions.administrator:
-            embed = discord.Embed(
-                title="Error",
-                description="You need administrator permissions to use this command.",
-                color=discord.Color.red(),
-            )
+            embed = discord.Embed.from_dict(_ADMIN_REQUIRED_EMBED)
             await interaction.followup.send(embed=embed, ephemeral=True)
             return
 
-        embed = discord.Embed(
-            title="Not Implemented",
-            description="Admin setup will be implemented in a future update.",
-            color=discord.Color.orange(),
-        )
+        embed = discord.Embed.from_dict(_SETUP_NOT_IMPLEMENTED_EMBED)
         await interaction.followup.send(embed=embed, ephemeral=True)
 
     bot.tree.add_command(admin_group)
@@ -1,6 +1,8 @@
 """Base command infrastructure."""
 
+import functools
 import logging
+import time
 
 import discord
 from discord.ext import commands
@@ -9,6 +11,12 @@ from ...services.discord_context_service import DiscordContextService
 
 logger = logging.getLogger(__name__)
 
+# Static part of the error embed; only the description varies per call
+_ERROR_TEMPLATE = {"type": "rich", "title": "Error", "color": discord.Color.red().value}
+
+# Upper bound on deferred command handlers doing service work at once, per bot
+MAX_CONCURRENT_COMMANDS = 32
+
 
 class BaseCommand:
     """Base class for Discord commands with common functionality."""
@@ -44,9 +52,7 @@ class BaseCommand:
         if not interaction.guild or not interaction.channel:
             return None
 
-        guild_id = str(interaction.guild.id)
-        channel_id = str(interaction.channel.id)
-        user_id = str(interaction.user.id)
+        user_id, channel_id, guild_id = interaction_ids(interaction)
 
         return await self.context_service.resolve_context(
             guild_id=guild_id,
@@ -74,7 +80,7 @@ class BaseCommand:
         if not interaction.user:
             return False
 
-        user_id = str(interaction.user.id)
+        user_id = interaction_ids(interaction)[0]
         return await self.context_service.validate_permission(
             user_id=user_id,
             campaign_id=campaign_id,
@@ -95,11 +101,7 @@ class BaseCommand:
             error_message: Error message
             ephemeral: Whether message should be ephemeral
         """
-        embed = discord.Embed(
-            title="Error",
-            description=error_message,
-            color=discord.Color.red(),
-        )
+        embed = discord.Embed.from_dict({**_ERROR_TEMPLATE, "description": error_message})
 
         if interaction.response.is_done():
             await interaction.followup.send(embed=embed, ephemeral=ephemeral)
@@ -107,6 +109,33 @@ class BaseCommand:
             await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
 
 
+def interaction_ids(interaction: discord.Interaction) -> tuple[str, str | None, str | None]:
+    """
+    Get the interaction's user, channel, and guild IDs as strings.
+
+    The tuple is memoized in ``interaction.extras`` so every caller handling
+    the same interaction reuses one set of snowflake strings.
+
+    Args:
+        interaction: Discord interaction
+
+    Returns:
+        Tuple of (user_id, channel_id, guild_id); channel and guild IDs are
+        None when the interaction has no channel or guild
+    """
+    ids = interaction.extras.get("str_ids")
+    if ids is None:
+        channel = interaction.channel
+        guild = interaction.guild
+        ids = (
+            str(interaction.user.id),
+            str(channel.id) if channel else None,
+            str(guild.id) if guild else None,
+        )
+        interaction.extras["str_ids"] = ids
+    return ids
+
+
 def error_handler(func):
     """Decorator for error handling in commands."""
 
@@ -114,10 +143,151 @@ def error_handler(func):
         try:
             return await func(self, interaction, *args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in command {func.__name__}: {e}", exc_info=True)
+            logger.error("Error in command %s: %s", func.__name__, e, exc_info=True)
             await self.send_error(
                 interaction,
                 f"An error occurred: {e!s}",
             )
 
     return wrapper
+
+
+def deferred_ephemeral(func):
+    """
+    Decorator that defers the interaction before running the command.
+
+    The defer happens before any other work in the handler so the 3-second
+    interaction deadline is met even when service calls are slow. Handlers
+    then wait for one of the client's ``command_slots`` (created per bot in
+    setup_hook), so a burst of commands queues here instead of swamping the
+    storage I/O pool; this bounds handler bodies, not gateway dispatch.
+    Total handler time is logged for each invocation.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            await interaction.response.defer(ephemeral=True)
+        except discord.errors.NotFound:
+            logger.warning("Interaction expired before %s could defer", func.__name__)
+            return
+        try:
+            slots = getattr(interaction.client, "command_slots", None)
+            if slots is None:
+                return await func(interaction, *args, **kwargs)
+            async with slots:
+                return await func(interaction, *args, **kwargs)
+        finally:
+            logger.info(
+                "Command %s total=%.1fms",
+                func.__name__,
+                (time.perf_counter() - start) * 1000,
+            )
+
+    return wrapper
+
+
+def safe_command(func=None, *, error_embed: dict | None = None):
+    """
+    Decorator that reports unexpected errors from an app command handler.
+
+    Any exception escaping the handler is logged and answered with an
+    ephemeral followup. Apply it beneath ``deferred_ephemeral`` so the
+    interaction has already been deferred when the followup is sent.
+
+    Args:
+        func: Command handler (when used without arguments)
+        error_embed: Optional fixed embed payload to send instead of the
+            default "An error occurred" message with the exception text
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+            try:
+                return await func(interaction, *args, **kwargs)
+            except Exception as e:
+                logger.error("Error in %s: %s", func.__name__, e, exc_info=True)
+                payload = error_embed or {
+                    **_ERROR_TEMPLATE,
+                    "description": f"An error occurred: {e!s}",
+                }
+                await interaction.followup.send(
+                    embed=discord.Embed.from_dict(payload), ephemeral=True
+                )
+
+        return wrapper
+
+    if func is None:
+        return decorator
+    return decorator(func)
+
+
+@functools.lru_cache(maxsize=256)
+def _error_embed_payload(title: str, description: str) -> dict:
+    """Return the cached embed payload for an error title and description."""
+    return {
+        "type": "rich",
+        "title": f"❌ {title}",
+        "description": description,
+        "color": discord.Color.red().value,
+    }
+
+
+def build_error_embed(title: str, description: str) -> discord.Embed:
+    """
+    Build error embed.
+
+    Payloads are cached, so the handful of recurring error messages are
+    built once and only rehydrated into an Embed per call.
+
+    Args:
+        title: Error title
+        description: Error description
+
+    Returns:
+        Discord Embed styled as error
+    """
+    return discord.Embed.from_dict(_error_embed_payload(title, description))
+
+
+def discord_command_errors(
+    func=None,
+    *,
+    value_error_title: str = "Error",
+    unexpected_message: str = "An unexpected error occurred.",
+):
+    """
+    Decorator that maps exceptions from an app command handler to error embeds.
+
+    ValueError carries a user-facing message and is shown as-is,
+    FileNotFoundError is shown as "Not Found", and any other exception is
+    logged and answered with a generic message. Apply it beneath
+    ``deferred_ephemeral`` so the interaction has already been deferred.
+
+    Args:
+        func: Command handler (when used without arguments)
+        value_error_title: Embed title for ValueError messages
+        unexpected_message: Description shown for unexpected errors
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+            try:
+                return await func(interaction, *args, **kwargs)
+            except ValueError as e:
+                embed = build_error_embed(value_error_title, str(e))
+            except FileNotFoundError as e:
+                embed = build_error_embed("Not Found", str(e))
+            except Exception as e:
+                logger.error("Error in %s: %s", func.__name__, e, exc_info=True)
+                embed = build_error_embed("Error", unexpected_message)
+            await interaction.followup.send(embed=embed, ephemeral=True)
+
+        return wrapper
+
+    if func is None:
+        return decorator
+    return decorator(func)
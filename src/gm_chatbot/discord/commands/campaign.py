@@ -1,17 +1,146 @@
 """Campaign commands for Discord bot."""
 
 import logging
+from typing import Any
 
 import discord
 from discord import app_commands
 
+from ...lib.types import CampaignStatus
+from ...models.campaign import Campaign
+from ...models.player import Player
 from ..bot import DiscordBot
+from .base import deferred_ephemeral, interaction_ids, safe_command
 
 logger = logging.getLogger(__name__)
 
+# Static embeds are built from immutable payloads instead of per-call kwargs
+_SERVER_ONLY_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": "This command can only be used in a server.",
+    "color": discord.Color.red().value,
+}
+_NO_CAMPAIGNS_EMBED = {
+    "type": "rich",
+    "title": "No Campaigns",
+    "description": "No campaigns are bound to channels in this server.",
+    "color": discord.Color.orange().value,
+}
+_NO_CAMPAIGN_FOUND_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": (
+        "No campaign found. Either provide a campaign ID or use this command in a bound channel."
+    ),
+    "color": discord.Color.red().value,
+}
+_SERVER_CHANNEL_REQUIRED_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": "This command must be used in a server channel.",
+    "color": discord.Color.red().value,
+}
+_CHANNEL_NOT_BOUND_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": "Channel not bound to a campaign. Provide campaign_id or use a bound channel.",
+    "color": discord.Color.red().value,
+}
+_ALREADY_MEMBER_EMBED = {
+    "type": "rich",
+    "title": "Already a Member",
+    "description": "You are already a member of this campaign.",
+    "color": discord.Color.orange().value,
+}
+_UNEXPECTED_ERROR_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": "An unexpected error occurred. Please try again later.",
+    "color": discord.Color.red().value,
+}
+_SERVER_CHANNEL_ONLY_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": "This command can only be used in a server channel.",
+    "color": discord.Color.red().value,
+}
+_BIND_PERMISSION_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": (
+        "You need GM permissions, server administrator role, "
+        "server owner status, or Discord 'GM' role to bind campaigns."
+    ),
+    "color": discord.Color.red().value,
+}
+_LINK_ACCOUNT_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": "Please link your Discord account first.",
+    "color": discord.Color.red().value,
+}
+_ARCHIVE_PERMISSION_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": "You need GM permissions to archive campaigns.",
+    "color": discord.Color.red().value,
+}
+_DELETE_PERMISSION_EMBED = {
+    "type": "rich",
+    "title": "Error",
+    "description": "You need GM permissions to delete campaigns.",
+    "color": discord.Color.red().value,
+}
+
+# Discord role names (casefolded) that grant channel binding rights
+_GM_ROLE_NAMES: frozenset[str] = frozenset({"gm"})
+
+
+def _campaign_summary_fields(campaign: Campaign) -> list[dict[str, Any]]:
+    """
+    Build the ID/system/status embed fields shared by campaign embeds.
+
+    Args:
+        campaign: Campaign to summarize
+
+    Returns:
+        Embed field payloads
+    """
+    return [
+        {"name": "Campaign ID", "value": campaign.metadata.id, "inline": False},
+        {"name": "System", "value": campaign.rule_system, "inline": True},
+        {"name": "Status", "value": str(campaign.status), "inline": True},
+    ]
+
+
+async def _get_or_link_player(
+    bot: DiscordBot,
+    interaction: discord.Interaction,
+    user_id: str,
+) -> Player:
+    """
+    Resolve the invoking Discord user's player, auto-linking new users.
+
+    Args:
+        bot: Discord bot instance
+        interaction: Discord interaction
+        user_id: Invoking Discord user ID (snowflake)
+
+    Returns:
+        Linked player
+    """
+    return await bot.linking_service.ensure_player(
+        discord_user_id=user_id,
+        discord_username=str(interaction.user),
+        guild_id=interaction_ids(interaction)[2],
+        guild_name=interaction.guild.name if interaction.guild else None,
+    )
+
 
 async def _check_can_bind_channel(
     interaction: discord.Interaction,
+    user_id: str,
     campaign_id: str,
     bot: DiscordBot,
 ) -> bool:
@@ -26,6 +155,7 @@ async def _check_can_bind_channel(
 
     Args:
         interaction: Discord interaction
+        user_id: Invoking Discord user ID (snowflake)
         campaign_id: Campaign identifier
         bot: Discord bot instance
 
@@ -35,25 +165,22 @@ async def _check_can_bind_channel(
     if not interaction.guild:
         return False
 
+    member = interaction.user
+
     # 1. Check server administrator
-    if interaction.user.guild_permissions.administrator:
+    if member.guild_permissions.administrator:
         return True
 
     # 2. Check server owner
-    if interaction.guild.owner_id == interaction.user.id:
+    if interaction.guild.owner_id == member.id:
         return True
 
     # 3. Check Discord role "GM" (case-insensitive)
-    user_roles = [role.name.lower() for role in interaction.user.roles]
-    if "gm" in user_roles:
+    if any(role.name.casefold() in _GM_ROLE_NAMES for role in member.roles):
         return True
 
     # 4. Check campaign GM membership
-    user_id = str(interaction.user.id)
-    has_permission = await bot.context_service.validate_permission(
-        user_id, campaign_id, "gm"
-    )
-    return has_permission
+    return await bot.context_service.validate_permission(user_id, campaign_id, "gm")
 
 
 def setup_campaign_commands(bot: DiscordBot) -> None:
@@ -74,6 +201,8 @@ def setup_campaign_commands(bot: DiscordBot) -> None:
         system="Game system (e.g., shadowdark, dnd5e)",
         description="Optional campaign description",
     )
+    @deferred_ephemeral
+    @safe_command
     async def create_campaign(
         interaction: discord.Interaction,
         name: str,
@@ -81,157 +210,122 @@ def setup_campaign_commands(bot: DiscordBot) -> None:
         description: str | None = None,
     ) -> None:
         """Create a new campaign."""
-        await interaction.response.defer(ephemeral=True)
-
-        try:
-            # Resolve player from Discord user
-            user_id = str(interaction.user.id)
-            player = await bot.linking_service.get_player_by_discord_id(user_id)
-            if not player:
-                # Auto-link user
-                await bot.linking_service.link_discord_user(
-                    discord_user_id=user_id,
-                    discord_username=str(interaction.user),
-                    guild_id=str(interaction.guild.id) if interaction.guild else None,
-                    guild_name=interaction.guild.name if interaction.guild else None,
-                )
-                player = await bot.linking_service.get_player_by_discord_id(user_id)
-                if not player:
-                    raise ValueError("Failed to create player account")
-
-            # Create campaign
-            campaign = await bot.campaign_service.create_campaign(
-                name=name,
-                rule_system=system,
-                description=description,
-                created_by=player.metadata.id,
+        # Resolve player from Discord user
+        user_id = interaction_ids(interaction)[0]
+        player = await _get_or_link_player(bot, interaction, user_id)
+
+        # Create campaign
+        campaign = await bot.campaign_service.create_campaign(
+            name=name,
+            rule_system=system,
+            description=description,
+            created_by=player.metadata.id,
+        )
+
+        # Automatically add creator as GM member
+        membership = await bot.campaign_service.add_player(
+            campaign_id=campaign.metadata.id,
+            player_id=player.metadata.id,
+            role="gm",
+            if_not_exists=True,
+        )
+        if membership:
+            logger.info(
+                "Auto-added campaign creator %s as GM for campaign %s",
+                player.metadata.id,
+                campaign.metadata.id,
             )
-
-            # Automatically add creator as GM member
-            try:
-                await bot.campaign_service.add_player(
-                    campaign_id=campaign.metadata.id,
-                    player_id=player.metadata.id,
-                    role="gm",
-                )
-                logger.info(
-                    f"Auto-added campaign creator {player.metadata.id} as GM "
-                    f"for campaign {campaign.metadata.id}"
-                )
-            except ValueError:
-                # Already a member (shouldn't happen, but handle gracefully)
-                logger.warning(
-                    f"Creator {player.metadata.id} already a member of "
-                    f"campaign {campaign.metadata.id}"
-                )
-
-            embed = discord.Embed(
-                title="Campaign Created",
-                description=f"Campaign **{campaign.name}** has been created.",
-                color=discord.Color.green(),
+        else:
+            # Already a member (shouldn't happen, but handle gracefully)
+            logger.warning(
+                "Creator %s already a member of campaign %s",
+                player.metadata.id,
+                campaign.metadata.id,
             )
-            embed.add_field(name="Campaign ID", value=campaign.metadata.id, inline=False)
-            embed.add_field(name="System", value=campaign.rule_system, inline=True)
-            embed.add_field(name="Status", value=campaign.status, inline=True)
 
-            await interaction.followup.send(embed=embed, ephemeral=True)
-        except Exception as e:
-            logger.error(f"Error in create_campaign: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="Error",
-                description=f"An error occurred: {e!s}",
-                color=discord.Color.red(),
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed.from_dict(
+            {
+                "type": "rich",
+                "title": "Campaign Created",
+                "description": f"Campaign **{campaign.name}** has been created.",
+                "color": discord.Color.green().value,
+                "fields": _campaign_summary_fields(campaign),
+            }
+        )
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @campaign_group.command(name="list", description="List campaigns in this server")
+    @deferred_ephemeral
+    @safe_command
     async def list_campaigns(interaction: discord.Interaction) -> None:
         """List campaigns in the guild."""
-        await interaction.response.defer(ephemeral=True)
-
-        try:
-            if not interaction.guild:
-                embed = discord.Embed(
-                    title="Error",
-                    description="This command can only be used in a server.",
-                    color=discord.Color.red(),
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
-
-            guild_id = str(interaction.guild.id)
-            bindings = await bot.binding_service.list_campaigns_in_guild(guild_id)
-
-            if not bindings:
-                embed = discord.Embed(
-                    title="No Campaigns",
-                    description="No campaigns are bound to channels in this server.",
-                    color=discord.Color.orange(),
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
-
-            embed = discord.Embed(
-                title="Campaigns",
-                description=f"Found {len(bindings)} campaign(s) in this server:",
-                color=discord.Color.blue(),
-            )
-
-            for binding in bindings[:10]:  # Limit to 10 campaigns
-                try:
-                    campaign = await bot.campaign_service.get_campaign(binding.campaign_id)
-                    embed.add_field(
-                        name=campaign.name,
-                        value=f"ID: {campaign.metadata.id}\nChannel: <#{binding.channel_id}>",
-                        inline=False,
-                    )
-                except Exception:
-                    continue
+        if not interaction.guild:
+            embed = discord.Embed.from_dict(_SERVER_ONLY_EMBED)
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            return
 
-            if len(bindings) > 10:
-                embed.set_footer(text=f"Showing 10 of {len(bindings)} campaigns")
+        guild_id = interaction_ids(interaction)[2]
+        bindings = await bot.binding_service.list_campaigns_in_guild(guild_id)
 
+        if not bindings:
+            embed = discord.Embed.from_dict(_NO_CAMPAIGNS_EMBED)
             await interaction.followup.send(embed=embed, ephemeral=True)
-        except Exception as e:
-            logger.error(f"Error in list_campaigns: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="Error",
-                description=f"An error occurred: {e!s}",
-                color=discord.Color.red(),
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            return
+
+        # Limit to 10 campaigns and load them in one pass
+        shown_bindings = bindings[:10]
+        campaigns = await bot.campaign_service.get_campaigns(
+            [binding.campaign_id for binding in shown_bindings]
+        )
+        fields = [
+            {
+                "name": campaign.name,
+                "value": f"ID: {campaign.metadata.id}\nChannel: <#{binding.channel_id}>",
+                "inline": False,
+            }
+            for binding in shown_bindings
+            if (campaign := campaigns.get(binding.campaign_id)) is not None
+        ]
+
+        embed = discord.Embed.from_dict(
+            {
+                "type": "rich",
+                "title": "Campaigns",
+                "description": f"Found {len(bindings)} campaign(s) in this server:",
+                "color": discord.Color.blue().value,
+                "fields": fields,
+            }
+        )
+
+        if len(bindings) > 10:
+            embed.set_footer(text=f"Showing 10 of {len(bindings)} campaigns")
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @campaign_group.command(name="info", description="Show campaign details")
     @app_commands.describe(
         campaign_id="Campaign ID (optional, uses current channel if not provided)"
     )
+    @deferred_ephemeral
+    @safe_command
     async def campaign_info(
         interaction: discord.Interaction,
         campaign_id: str | None = None,
     ) -> None:
         """Show campaign details."""
-        await interaction.response.defer(ephemeral=True)
-
         try:
             # Resolve campaign
             if not campaign_id:
                 if not interaction.guild or not interaction.channel:
-                    embed = discord.Embed(
-                        title="Error",
-                        description="No campaign found. Either provide a campaign ID or use this command in a bound channel.",
-                        color=discord.Color.red(),
-                    )
+                    embed = discord.Embed.from_dict(_NO_CAMPAIGN_FOUND_EMBED)
                     await interaction.followup.send(embed=embed, ephemeral=True)
                     return
 
-                channel_id = str(interaction.channel.id)
+                channel_id = interaction_ids(interaction)[1]
                 campaign_id = await bot.binding_service.get_campaign_by_channel(channel_id)
                 if not campaign_id:
-                    embed = discord.Embed(
-                        title="Error",
-                        description="No campaign found. Either provide a campaign ID or use this command in a bound channel.",
-                        color=discord.Color.red(),
-                    )
+                    embed = discord.Embed.from_dict(_NO_CAMPAIGN_FOUND_EMBED)
                     await interaction.followup.send(embed=embed, ephemeral=True)
                     return
 
@@ -240,22 +334,26 @@ def setup_campaign_commands(bot: DiscordBot) -> None:
             # Get binding if exists
             binding = await bot.binding_service.get_binding(campaign.metadata.id)
 
-            embed = discord.Embed(
-                title=campaign.name,
-                description=campaign.description or "No description",
-                color=discord.Color.blue(),
-            )
-            embed.add_field(name="Campaign ID", value=campaign.metadata.id, inline=False)
-            embed.add_field(name="System", value=campaign.rule_system, inline=True)
-            embed.add_field(name="Status", value=campaign.status, inline=True)
-
+            fields = _campaign_summary_fields(campaign)
             if binding:
-                embed.add_field(
-                    name="Discord Channel",
-                    value=f"<#{binding.channel_id}>",
-                    inline=False,
+                fields.append(
+                    {
+                        "name": "Discord Channel",
+                        "value": f"<#{binding.channel_id}>",
+                        "inline": False,
+                    }
                 )
 
+            embed = discord.Embed.from_dict(
+                {
+                    "type": "rich",
+                    "title": campaign.name,
+                    "description": campaign.description or "No description",
+                    "color": discord.Color.blue().value,
+                    "fields": fields,
+                }
+            )
+
             await interaction.followup.send(embed=embed, ephemeral=True)
         except FileNotFoundError:
             embed = discord.Embed(
@@ -264,14 +362,6 @@ def setup_campaign_commands(bot: DiscordBot) -> None:
                 color=discord.Color.red(),
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
-        except Exception as e:
-            logger.error(f"Error in campaign_info: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="Error",
-                description=f"An error occurred: {e!s}",
-                color=discord.Color.red(),
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
 
     @campaign_group.command(
         name="join",
@@ -280,66 +370,42 @@ def setup_campaign_commands(bot: DiscordBot) -> None:
     @app_commands.describe(
         campaign_id="Campaign ID (optional, uses current channel if not provided)"
     )
+    @deferred_ephemeral
+    @safe_command(error_embed=_UNEXPECTED_ERROR_EMBED)
     async def join_campaign(
         interaction: discord.Interaction,
         campaign_id: str | None = None,
     ) -> None:
         """Join a campaign."""
-        await interaction.response.defer(ephemeral=True)
-
         try:
             if not interaction.guild or not interaction.channel:
-                embed = discord.Embed(
-                    title="Error",
-                    description="This command must be used in a server channel.",
-                    color=discord.Color.red(),
-                )
+                embed = discord.Embed.from_dict(_SERVER_CHANNEL_REQUIRED_EMBED)
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
 
+            user_id, channel_id, _ = interaction_ids(interaction)
+
             # Resolve campaign
             if not campaign_id:
-                channel_id = str(interaction.channel.id)
                 campaign_id = await bot.binding_service.get_campaign_by_channel(
                     channel_id
                 )
                 if not campaign_id:
-                    embed = discord.Embed(
-                        title="Error",
-                        description=(
-                            "Channel not bound to a campaign. "
-                            "Provide campaign_id or use a bound channel."
-                        ),
-                        color=discord.Color.red(),
-                    )
+                    embed = discord.Embed.from_dict(_CHANNEL_NOT_BOUND_EMBED)
                     await interaction.followup.send(embed=embed, ephemeral=True)
                     return
 
-            # Resolve player
-            user_id = str(interaction.user.id)
-            player = await bot.linking_service.get_player_by_discord_id(user_id)
-            if not player:
-                # Auto-link user
-                await bot.linking_service.link_discord_user(
-                    discord_user_id=user_id,
-                    discord_username=str(interaction.user),
-                    guild_id=str(interaction.guild.id),
-                    guild_name=interaction.guild.name,
-                )
-                player = await bot.linking_service.get_player_by_discord_id(user_id)
-                if not player:
-                    raise ValueError("Failed to create player account")
+            # Load the campaign before auto-linking so a missing campaign
+            # never creates a player record
+            campaign = await bot.campaign_service.get_campaign(campaign_id)
+            player = await _get_or_link_player(bot, interaction, user_id)
 
             # Check if already a member
             existing = await bot.campaign_service.get_membership(
                 campaign_id, player.metadata.id
             )
             if existing:
-                embed = discord.Embed(
-                    title="Already a Member",
-                    description="You are already a member of this campaign.",
-                    color=discord.Color.orange(),
-                )
+                embed = discord.Embed.from_dict(_ALREADY_MEMBER_EMBED)
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
 
@@ -350,21 +416,21 @@ def setup_campaign_commands(bot: DiscordBot) -> None:
                 role="player",
             )
 
-            # Get campaign info
-            campaign = await bot.campaign_service.get_campaign(campaign_id)
-
             # Build success embed
-            embed = discord.Embed(
-                title="Joined Campaign",
-                description=f"You have joined **{campaign.name}**!",
-                color=discord.Color.green(),
+            embed = discord.Embed.from_dict(
+                {
+                    "type": "rich",
+                    "title": "Joined Campaign",
+                    "description": f"You have joined **{campaign.name}**!",
+                    "color": discord.Color.green().value,
+                    "fields": [
+                        {"name": "Campaign ID", "value": campaign.metadata.id, "inline": False},
+                        {"name": "Role", "value": "Player", "inline": True},
+                        {"name": "System", "value": campaign.rule_system, "inline": True},
+                    ],
+                    "footer": {"text": "Use /character create to create your character"},
+                }
             )
-            embed.add_field(
-                name="Campaign ID", value=campaign.metadata.id, inline=False
-            )
-            embed.add_field(name="Role", value="Player", inline=True)
-            embed.add_field(name="System", value=campaign.rule_system, inline=True)
-            embed.set_footer(text="Use /character create to create your character")
 
             await interaction.followup.send(embed=embed, ephemeral=True)
 
@@ -382,114 +448,77 @@ def setup_campaign_commands(bot: DiscordBot) -> None:
                 color=discord.Color.red(),
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
-        except Exception as e:
-            logger.error(f"Error in join_campaign: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="Error",
-                description="An unexpected error occurred. Please try again later.",
-                color=discord.Color.red(),
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
 
     @campaign_group.command(
         name="set-channel",
         description="Bind campaign to current channel",
     )
     @app_commands.describe(campaign_id="Campaign ID")
+    @deferred_ephemeral
+    @safe_command
     async def set_channel(
         interaction: discord.Interaction,
         campaign_id: str,
     ) -> None:
         """Bind campaign to current channel."""
-        await interaction.response.defer(ephemeral=True)
-
-        try:
-            if not interaction.guild or not interaction.channel:
-                embed = discord.Embed(
-                    title="Error",
-                    description="This command can only be used in a server channel.",
-                    color=discord.Color.red(),
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
-
-            # Check permission using enhanced permission check
-            if not await _check_can_bind_channel(interaction, campaign_id, bot):
-                embed = discord.Embed(
-                    title="Error",
-                    description=(
-                        "You need GM permissions, server administrator role, "
-                        "server owner status, or Discord 'GM' role to bind campaigns."
-                    ),
-                    color=discord.Color.red(),
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
-
-            # Resolve player
-            user_id = str(interaction.user.id)
-            player = await bot.linking_service.get_player_by_discord_id(user_id)
-            if not player:
-                embed = discord.Embed(
-                    title="Error",
-                    description="Please link your Discord account first.",
-                    color=discord.Color.red(),
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
-
-            # Create binding
-            channel_name = interaction.channel.name if interaction.channel.name else "Unknown"
-            binding = await bot.binding_service.bind_campaign_to_channel(
-                campaign_id=campaign_id,
-                guild_id=str(interaction.guild.id),
-                channel_id=str(interaction.channel.id),
-                channel_name=channel_name,
-                bound_by=player.metadata.id,
-            )
+        if not interaction.guild or not interaction.channel:
+            embed = discord.Embed.from_dict(_SERVER_CHANNEL_ONLY_EMBED)
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            return
 
-            embed = discord.Embed(
-                title="Channel Bound",
-                description=f"Campaign is now bound to <#{binding.channel_id}>",
-                color=discord.Color.green(),
-            )
+        user_id, channel_id, guild_id = interaction_ids(interaction)
 
+        # Check permission using enhanced permission check
+        if not await _check_can_bind_channel(interaction, user_id, campaign_id, bot):
+            embed = discord.Embed.from_dict(_BIND_PERMISSION_EMBED)
             await interaction.followup.send(embed=embed, ephemeral=True)
-        except Exception as e:
-            logger.error(f"Error in set_channel: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="Error",
-                description=f"An error occurred: {e!s}",
-                color=discord.Color.red(),
-            )
+            return
+
+        # Resolve player
+        player = await bot.linking_service.get_player_by_discord_id(user_id)
+        if not player:
+            embed = discord.Embed.from_dict(_LINK_ACCOUNT_EMBED)
             await interaction.followup.send(embed=embed, ephemeral=True)
+            return
+
+        # Create binding
+        channel_name = interaction.channel.name if interaction.channel.name else "Unknown"
+        binding = await bot.binding_service.bind_campaign_to_channel(
+            campaign_id=campaign_id,
+            guild_id=guild_id,
+            channel_id=channel_id,
+            channel_name=channel_name,
+            bound_by=player.metadata.id,
+        )
+
+        embed = discord.Embed(
+            title="Channel Bound",
+            description=f"Campaign is now bound to <#{binding.channel_id}>",
+            color=discord.Color.green(),
+        )
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @campaign_group.command(name="archive", description="Archive a campaign")
     @app_commands.describe(campaign_id="Campaign ID")
+    @deferred_ephemeral
+    @safe_command
     async def archive_campaign(
         interaction: discord.Interaction,
         campaign_id: str,
     ) -> None:
         """Archive a campaign."""
-        await interaction.response.defer(ephemeral=True)
-
         try:
             # Check permission
-            user_id = str(interaction.user.id)
+            user_id = interaction_ids(interaction)[0]
             has_permission = await bot.context_service.validate_permission(
                 user_id, campaign_id, "gm"
             )
             if not has_permission:
-                embed = discord.Embed(
-                    title="Error",
-                    description="You need GM permissions to archive campaigns.",
-                    color=discord.Color.red(),
-                )
+                embed = discord.Embed.from_dict(_ARCHIVE_PERMISSION_EMBED)
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
 
-            from ...lib.types import CampaignStatus
-
             campaign = await bot.campaign_service.get_campaign(campaign_id)
             campaign.status = CampaignStatus.ARCHIVED
             await bot.campaign_service.update_campaign(campaign)
@@ -508,46 +537,31 @@ def setup_campaign_commands(bot: DiscordBot) -> None:
                 color=discord.Color.red(),
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
-        except Exception as e:
-            logger.error(f"Error in archive_campaign: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="Error",
-                description=f"An error occurred: {e!s}",
-                color=discord.Color.red(),
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
 
     @campaign_group.command(name="delete", description="Delete a campaign")
     @app_commands.describe(campaign_id="Campaign ID")
+    @deferred_ephemeral
+    @safe_command
     async def delete_campaign(
         interaction: discord.Interaction,
         campaign_id: str,
     ) -> None:
         """Delete a campaign."""
-        await interaction.response.defer(ephemeral=True)
-
         try:
             # Check permission
-            user_id = str(interaction.user.id)
+            user_id = interaction_ids(interaction)[0]
             has_permission = await bot.context_service.validate_permission(
                 user_id, campaign_id, "gm"
             )
             if not has_permission:
-                embed = discord.Embed(
-                    title="Error",
-                    description="You need GM permissions to delete campaigns.",
-                    color=discord.Color.red(),
-                )
+                embed = discord.Embed.from_dict(_DELETE_PERMISSION_EMBED)
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
 
             campaign = await bot.campaign_service.get_campaign(campaign_id)
 
             # Delete binding if exists
-            try:
-                await bot.binding_service.unbind_campaign(campaign_id)
-            except FileNotFoundError:
-                pass
+            await bot.binding_service.unbind_campaign_if_exists(campaign_id)
 
             # Delete campaign
             await bot.campaign_service.delete_campaign(campaign_id)
@@ -566,14 +580,6 @@ def setup_campaign_commands(bot: DiscordBot) -> None:
                 color=discord.Color.red(),
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
-        except Exception as e:
-            logger.error(f"Error in delete_campaign: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="Error",
-                description=f"An error occurred: {e!s}",
-                color=discord.Color.red(),
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
 
     # Register the group to the bot
     bot.tree.add_command(campaign_group)
@@ -11,15 +11,57 @@ Architecture Notes:
 - Domain models translated to Discord embeds here
 """
 
+import asyncio
 import logging
 
 import discord
 from discord import app_commands
 
 from ..bot import DiscordBot
+from .base import deferred_ephemeral, discord_command_errors, interaction_ids
 
 logger = logging.getLogger(__name__)
 
+# Static placeholder embeds for commands that are not implemented yet
+_LIST_NOT_IMPLEMENTED_EMBED = {
+    "type": "rich",
+    "title": "Not Implemented",
+    "description": "Character listing will be implemented in a future update.",
+    "color": discord.Color.orange().value,
+}
+_SHEET_NOT_IMPLEMENTED_EMBED = {
+    "type": "rich",
+    "title": "Not Implemented",
+    "description": "Character sheet display will be implemented in a future update.",
+    "color": discord.Color.orange().value,
+}
+
+# Static parts of the character-created embed
+_CHARACTER_CREATED_TEMPLATE = {
+    "type": "rich",
+    "title": "✅ Character Created",
+    "color": discord.Color.green().value,
+    "footer": {"text": "Use /character view to see your full character sheet"},
+}
+
+# Per-user rate for create/view: invocations allowed per window (seconds)
+_COMMAND_COOLDOWN_RATE = 3
+_COMMAND_COOLDOWN_PER = 10.0
+
+# Display order for the standard abilities (full names and abbreviations)
+ABILITY_ORDER = (
+    ("strength", "str"),
+    ("dexterity", "dex"),
+    ("constitution", "con"),
+    ("intelligence", "int"),
+    ("wisdom", "wis"),
+    ("charisma", "cha"),
+)
+_ABILITY_RANK = {name: rank for rank, names in enumerate(ABILITY_ORDER) for name in names}
+
+# Rendered character sheets kept per bot in DiscordBot.sheet_cache
+_SHEET_CACHE_MAXSIZE = 512
+
 
 def setup_character_commands(bot: DiscordBot) -> None:
     """
@@ -37,6 +79,14 @@ def setup_character_commands(bot: DiscordBot) -> None:
         name="create", description="Create a new character in the current campaign"
     )
     @app_commands.describe(name="Character name (1-100 characters)")
+    @app_commands.checks.cooldown(
+        _COMMAND_COOLDOWN_RATE, _COMMAND_COOLDOWN_PER, key=lambda i: i.user.id
+    )
+    @deferred_ephemeral
+    @discord_command_errors(
+        value_error_title="Cannot Create Character",
+        unexpected_message="An unexpected error occurred. Please try again later.",
+    )
     async def create_character(
         interaction: discord.Interaction,
         name: str,
@@ -51,124 +101,92 @@ def setup_character_commands(bot: DiscordBot) -> None:
         4. Link to membership via CampaignService
         5. Translate result to Discord embed
         """
-        await interaction.response.defer(ephemeral=True)
-
-        try:
-            # ─────────────────────────────────────────────────────
-            # ADAPTER LAYER: Extract Discord primitives
-            # ─────────────────────────────────────────────────────
-            name = name.strip()
-            if not name or len(name) > 100:
-                raise ValueError("Character name must be 1-100 characters")
-
-            if not interaction.guild or not interaction.channel:
-                raise ValueError("This command must be used in a server channel")
-
-            # Convert Discord types to domain primitives (strings)
-            user_id = str(interaction.user.id)
-            channel_id = str(interaction.channel.id)
-            guild_id = str(interaction.guild.id)
-            discord_username = str(interaction.user)
-            guild_name = interaction.guild.name
-
-            # ─────────────────────────────────────────────────────
-            # SERVICE LAYER: Resolve context
-            # ─────────────────────────────────────────────────────
-            player = await bot.linking_service.get_player_by_discord_id(user_id)
-            if not player:
-                # Auto-link new Discord user
-                await bot.linking_service.link_discord_user(
-                    discord_user_id=user_id,
-                    discord_username=discord_username,
-                    guild_id=guild_id,
-                    guild_name=guild_name,
-                )
-                player = await bot.linking_service.get_player_by_discord_id(user_id)
-                if not player:
-                    raise ValueError("Failed to create player account")
-
-            # Resolve campaign from channel binding
-            campaign_id = await bot.binding_service.get_campaign_by_channel(channel_id)
-            if not campaign_id:
-                raise ValueError(
-                    "This channel is not bound to a campaign. "
-                    "Ask a GM to run `/campaign set-channel` first."
-                )
-
-            # ─────────────────────────────────────────────────────
-            # SERVICE LAYER: Check membership and auto-join if needed
-            # ─────────────────────────────────────────────────────
-            membership = await bot.campaign_service.get_membership(
-                campaign_id, player.metadata.id
+        # ─────────────────────────────────────────────────────
+        # ADAPTER LAYER: Extract Discord primitives
+        # ─────────────────────────────────────────────────────
+        name = name.strip()
+        if not name or len(name) > 100:
+            raise ValueError("Character name must be 1-100 characters")
+
+        if not interaction.guild or not interaction.channel:
+            raise ValueError("This command must be used in a server channel")
+
+        # Convert Discord types to domain primitives (strings)
+        user_id, channel_id, guild_id = interaction_ids(interaction)
+        discord_username = str(interaction.user)
+        guild_name = interaction.guild.name
+
+        # ─────────────────────────────────────────────────────
+        # SERVICE LAYER: Resolve context
+        # ─────────────────────────────────────────────────────
+        # Player and channel binding are independent; resolve both at once
+        player, campaign_id = await asyncio.gather(
+            bot.linking_service.ensure_player(user_id, discord_username, guild_id, guild_name),
+            bot.binding_service.get_campaign_by_channel(channel_id),
+        )
+        if not campaign_id:
+            raise ValueError(
+                "This channel is not bound to a campaign. "
+                "Ask a GM to run `/campaign set-channel` first."
             )
-            if not membership:
-                # Auto-join user to campaign
-                try:
-                    membership = await bot.campaign_service.add_player(
-                        campaign_id=campaign_id,
-                        player_id=player.metadata.id,
-                        role="player",
-                    )
-                    logger.info(
-                        f"Auto-joined player {player.metadata.id} to campaign {campaign_id}"
-                    )
-                except ValueError as e:
-                    # Handle edge case (shouldn't happen, but handle gracefully)
-                    raise ValueError(f"Failed to join campaign: {e}")
-
-            # Check for existing character (business rule)
-            if membership.character_id:
-                raise ValueError(
-                    "You already have a character in this campaign. "
-                    "Use `/character view` to see your character sheet."
-                )
 
-            # ─────────────────────────────────────────────────────
-            # SERVICE LAYER: Create character (domain operation)
-            # ─────────────────────────────────────────────────────
-            character = await bot.character_service.create_character(
-                campaign_id=campaign_id,
-                character_type="player_character",
-                name=name,
-                identity={"player_name": discord_username},
-            )
+        # ─────────────────────────────────────────────────────
+        # SERVICE LAYER: Check membership (auto-join is deferred to the link)
+        # ─────────────────────────────────────────────────────
+        membership = await bot.campaign_service.get_membership(
+            campaign_id, player.metadata.id
+        )
 
-            # Link character to membership
-            await bot.campaign_service.update_membership(
-                campaign_id=campaign_id,
-                player_id=player.metadata.id,
-                character_id=character.metadata.id,
+        # Check for existing character (business rule)
+        if membership and membership.character_id:
+            raise ValueError(
+                "You already have a character in this campaign. "
+                "Use `/character view` to see your character sheet."
             )
 
-            # ─────────────────────────────────────────────────────
-            # ADAPTER LAYER: Translate to Discord embed
-            # ─────────────────────────────────────────────────────
-            embed = _build_character_created_embed(character)
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        # ─────────────────────────────────────────────────────
+        # SERVICE LAYER: Create character (domain operation)
+        # ─────────────────────────────────────────────────────
+        character = await bot.character_service.create_character(
+            campaign_id=campaign_id,
+            character_type="player_character",
+            name=name,
+            identity={"player_name": discord_username},
+        )
 
+        # Join the campaign if needed and link the character in one write
+        await bot.campaign_service.upsert_membership(
+            campaign_id=campaign_id,
+            player_id=player.metadata.id,
+            role="player",
+            character_id=character.metadata.id,
+        )
+        if not membership:
             logger.info(
-                f"Character created: {character.identity.name} "
-                f"(id={character.metadata.id}) for player {player.metadata.id} "
-                f"in campaign {campaign_id}"
+                "Auto-joined player %s to campaign %s", player.metadata.id, campaign_id
             )
 
-        except ValueError as e:
-            embed = _build_error_embed("Cannot Create Character", str(e))
-            await interaction.followup.send(embed=embed, ephemeral=True)
-
-        except FileNotFoundError as e:
-            embed = _build_error_embed("Not Found", str(e))
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        # ─────────────────────────────────────────────────────
+        # ADAPTER LAYER: Translate to Discord embed
+        # ─────────────────────────────────────────────────────
+        embed = _build_character_created_embed(character)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
-        except Exception as e:
-            logger.error(f"Error in create_character: {e}", exc_info=True)
-            embed = _build_error_embed(
-                "Error", "An unexpected error occurred. Please try again later."
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        logger.info(
+            "Character created: %s (id=%s) for player %s in campaign %s",
+            character.identity.name,
+            character.metadata.id,
+            player.metadata.id,
+            campaign_id,
+        )
 
     @character_group.command(name="view", description="View a character sheet")
     @app_commands.describe(player="Player to view (GMs only, defaults to yourself)")
+    @app_commands.checks.cooldown(
+        _COMMAND_COOLDOWN_RATE, _COMMAND_COOLDOWN_PER, key=lambda i: i.user.id
+    )
+    @deferred_ephemeral
+    @discord_command_errors
     async def view_character(
         interaction: discord.Interaction,
         player: discord.Member | None = None,
@@ -179,51 +197,52 @@ def setup_character_commands(bot: DiscordBot) -> None:
         Players can view their own character.
         GMs can view any player's character.
         """
-        await interaction.response.defer(ephemeral=True)
-
-        try:
-            if not interaction.guild or not interaction.channel:
-                raise ValueError("This command must be used in a server channel")
-
-            channel_id = str(interaction.channel.id)
-            user_id = str(interaction.user.id)
+        if not interaction.guild or not interaction.channel:
+            raise ValueError("This command must be used in a server channel")
 
-            # Resolve campaign from channel
-            campaign_id = await bot.binding_service.get_campaign_by_channel(channel_id)
-            if not campaign_id:
-                raise ValueError("This channel is not bound to a campaign")
+        user_id, channel_id, _ = interaction_ids(interaction)
 
-            # Resolve requesting player
-            requesting_player = await bot.linking_service.get_player_by_discord_id(
-                user_id
+        # Resolve campaign from channel and requesting player together
+        campaign_id, requesting_player = await asyncio.gather(
+            bot.binding_service.get_campaign_by_channel(channel_id),
+            bot.linking_service.get_player_by_discord_id(user_id),
+        )
+        if not campaign_id:
+            raise ValueError("This channel is not bound to a campaign")
+        if not requesting_player:
+            raise ValueError("You don't have a player account")
+
+        # Determine target player and validate permissions
+        if player and player.id != interaction.user.id:
+            # Viewing another player - require GM role
+            if not await bot.campaign_service.is_gm(
+                campaign_id, requesting_player.metadata.id
+            ):
+                raise ValueError("Only GMs can view other players' characters")
+
+            target_player = await bot.linking_service.get_player_by_discord_id(
+                str(player.id)
             )
-            if not requesting_player:
-                raise ValueError("You don't have a player account")
-
-            # Determine target player and validate permissions
-            if player and player.id != interaction.user.id:
-                # Viewing another player - require GM role
-                from ...lib.types import MembershipRole
-
-                requesting_membership = await bot.campaign_service.get_membership(
-                    campaign_id, requesting_player.metadata.id
-                )
-                if (
-                    not requesting_membership
-                    or requesting_membership.role != MembershipRole.GM
-                ):
-                    raise ValueError("Only GMs can view other players' characters")
-
-                target_player = await bot.linking_service.get_player_by_discord_id(
-                    str(player.id)
+            if not target_player:
+                raise ValueError(
+                    f"{player.display_name} doesn't have a player account"
                 )
-                if not target_player:
-                    raise ValueError(
-                        f"{player.display_name} doesn't have a player account"
-                    )
-            else:
-                target_player = requesting_player
+        else:
+            target_player = requesting_player
 
+        # Start loading the last-seen character while the membership
+        # is read; the prefetch is discarded if the membership disagrees
+        speculative_id = bot.campaign_service.cached_character_id(
+            campaign_id, target_player.metadata.id
+        )
+        prefetch = None
+        if speculative_id:
+            prefetch = asyncio.create_task(
+                bot.character_service.get_character(campaign_id, speculative_id)
+            )
+            prefetch.add_done_callback(_consume_task_exception)
+
+        try:
             # Get target's membership and character
             membership = await bot.campaign_service.get_membership(
                 campaign_id, target_player.metadata.id
@@ -237,37 +256,25 @@ def setup_character_commands(bot: DiscordBot) -> None:
                 )
 
             # Load character via service
-            character = await bot.character_service.get_character(
-                campaign_id, membership.character_id
-            )
-
-            # Build and send embed
-            embed = _build_character_sheet_embed(character)
-            await interaction.followup.send(embed=embed, ephemeral=True)
-
-        except ValueError as e:
-            embed = _build_error_embed("Error", str(e))
-            await interaction.followup.send(embed=embed, ephemeral=True)
-
-        except FileNotFoundError as e:
-            embed = _build_error_embed("Not Found", str(e))
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            if prefetch is not None and membership.character_id == speculative_id:
+                character = await prefetch
+            else:
+                character = await bot.character_service.get_character(
+                    campaign_id, membership.character_id
+                )
+        finally:
+            if prefetch is not None:
+                prefetch.cancel()
 
-        except Exception as e:
-            logger.error(f"Error in view_character: {e}", exc_info=True)
-            embed = _build_error_embed("Error", "An unexpected error occurred.")
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        # Build and send embed
+        embed = _build_character_sheet_embed(bot, character)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @character_group.command(name="list", description="List characters in campaign")
     async def list_characters(interaction: discord.Interaction) -> None:
         """List characters in campaign."""
-        await interaction.response.defer(ephemeral=True)
-        embed = discord.Embed(
-            title="Not Implemented",
-            description="Character listing will be implemented in a future update.",
-            color=discord.Color.orange(),
-        )
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed.from_dict(_LIST_NOT_IMPLEMENTED_EMBED)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @character_group.command(name="sheet", description="Display character sheet")
     @app_commands.describe(character_id="Character ID (optional)")
@@ -276,17 +283,18 @@ def setup_character_commands(bot: DiscordBot) -> None:
         character_id: str | None = None,
     ) -> None:
         """Display character sheet."""
-        await interaction.response.defer(ephemeral=True)
-        embed = discord.Embed(
-            title="Not Implemented",
-            description="Character sheet display will be implemented in a future update.",
-            color=discord.Color.orange(),
-        )
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed.from_dict(_SHEET_NOT_IMPLEMENTED_EMBED)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     bot.tree.add_command(character_group)
 
 
+def _consume_task_exception(task: asyncio.Task) -> None:
+    """Retrieve a finished task's exception so discarded prefetches stay quiet."""
+    if not task.cancelled():
+        task.exception()
+
+
 # ─────────────────────────────────────────────────────────────────
 # EMBED BUILDERS: Translate domain models to Discord embeds
 # ─────────────────────────────────────────────────────────────────
@@ -302,23 +310,56 @@ def _build_character_created_embed(character) -> discord.Embed:
     Returns:
         Discord Embed
     """
-    embed = discord.Embed(
-        title="✅ Character Created",
-        description=f"**{character.identity.name}** is ready for adventure!",
-        color=discord.Color.green(),
-    )
-    embed.add_field(
-        name="Character ID", value=f"`{character.metadata.id}`", inline=False
+    return discord.Embed.from_dict(
+        {
+            **_CHARACTER_CREATED_TEMPLATE,
+            "description": f"**{character.identity.name}** is ready for adventure!",
+            "fields": [
+                {"name": "Character ID", "value": f"`{character.metadata.id}`", "inline": False},
+                {"name": "Type", "value": "Player Character", "inline": True},
+                {"name": "Level", "value": str(character.identity.level), "inline": True},
+            ],
+        }
     )
-    embed.add_field(name="Type", value="Player Character", inline=True)
-    embed.add_field(name="Level", value=str(character.identity.level), inline=True)
-    embed.set_footer(text="Use /character view to see your full character sheet")
-    return embed
 
 
-def _build_character_sheet_embed(character) -> discord.Embed:
+def _build_character_sheet_embed(bot: DiscordBot, character) -> discord.Embed:
+    """
+    Build detailed character sheet embed, reusing unchanged renders.
+
+    Sheets are cached per bot by character ID and the stat key of the file
+    the character was loaded from, so any write to the file, including
+    hand edits, renders afresh. Characters not loaded from the store are
+    always rendered.
+
+    Args:
+        bot: Discord bot instance
+        character: CharacterSheet domain model
+
+    Returns:
+        Discord Embed with full character details
+    """
+    if character.source_key is None:
+        return _render_character_sheet_embed(character)
+
+    cache = bot.sheet_cache
+    key = (character.metadata.id, character.source_key)
+    payload = cache.get(key)
+    if payload is None:
+        payload = _render_character_sheet_embed(character).to_dict()
+        cache[key] = payload
+        if len(cache) > _SHEET_CACHE_MAXSIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+
+    # Fresh fields list so callers cannot mutate the cached payload
+    return discord.Embed.from_dict({**payload, "fields": list(payload.get("fields", []))})
+
+
+def _render_character_sheet_embed(character) -> discord.Embed:
     """
-    Build detailed character sheet embed.
+    Render detailed character sheet embed.
 
     Args:
         character: CharacterSheet domain model
@@ -333,22 +374,17 @@ def _build_character_sheet_embed(character) -> discord.Embed:
 
     # Identity section
     identity = character.identity
-    identity_lines = []
-    if identity.ancestry:
-        identity_lines.append(f"**Ancestry:** {identity.ancestry}")
-    if identity.class_name:
-        identity_lines.append(f"**Class:** {identity.class_name}")
-    identity_lines.append(f"**Level:** {identity.level}")
-    if identity.alignment:
-        identity_lines.append(f"**Alignment:** {identity.alignment}")
-    if identity.player_name:
-        identity_lines.append(f"**Player:** {identity.player_name}")
-
-    embed.add_field(
-        name="Identity",
-        value="\n".join(identity_lines) if identity_lines else "No details",
-        inline=False,
+    identity_pairs = (
+        ("Ancestry", identity.ancestry),
+        ("Class", identity.class_name),
+        ("Level", identity.level),
+        ("Alignment", identity.alignment),
+        ("Player", identity.player_name),
     )
+    identity_value = "\n".join(f"**{label}:** {value}" for label, value in identity_pairs if value)
+    # Omit the section entirely rather than sending a placeholder field
+    if identity_value:
+        embed.add_field(name="Identity", value=identity_value, inline=False)
 
     # Combat section
     combat = character.combat
@@ -362,8 +398,13 @@ def _build_character_sheet_embed(character) -> discord.Embed:
 
     # Abilities section
     if character.abilities:
+        # Standard abilities first in a fixed order; others keep stored order
         ability_lines = [
-            f"**{abbr}:** {score}" for abbr, score in character.abilities.items()
+            f"**{abbr}:** {score}"
+            for abbr, score in sorted(
+                character.abilities.items(),
+                key=lambda ability: _ABILITY_RANK.get(ability[0].casefold(), len(ABILITY_ORDER)),
+            )
         ]
         embed.add_field(
             name="Abilities",
@@ -373,11 +414,11 @@ def _build_character_sheet_embed(character) -> discord.Embed:
 
     # Inventory section (first 5 items)
     if character.inventory:
-        inventory_lines = []
-        for item in character.inventory[:5]:
-            equipped = "⚔️ " if item.equipped else ""
-            qty = f"(x{item.quantity})" if item.quantity > 1 else ""
-            inventory_lines.append(f"{equipped}{item.item} {qty}")
+        inventory_lines = [
+            f"{'⚔️ ' if item.equipped else ''}{item.item}"
+            f"{f' (x{item.quantity})' if item.quantity > 1 else ''}"
+            for item in character.inventory[:5]
+        ]
         if len(character.inventory) > 5:
             inventory_lines.append(f"... and {len(character.inventory) - 5} more")
         embed.add_field(
@@ -404,21 +445,3 @@ def _build_character_sheet_embed(character) -> discord.Embed:
     embed.set_footer(text=f"ID: {character.metadata.id}")
 
     return embed
-
-
-def _build_error_embed(title: str, description: str) -> discord.Embed:
-    """
-    Build error embed.
-
-    Args:
-        title: Error title
-        description: Error description
-
-    Returns:
-        Discord Embed styled as error
-    """
-    return discord.Embed(
-        title=f"❌ {title}",
-        description=description,
-        color=discord.Color.red(),
-    )
@@ -9,6 +9,20 @@ from ..bot import DiscordBot
 
 logger = logging.getLogger(__name__)
 
+# Static placeholder embeds for commands that are not implemented yet
+_ROLL_NOT_IMPLEMENTED_EMBED = {
+    "type": "rich",
+    "title": "Not Implemented",
+    "description": "Dice rolling will be implemented in a future update.",
+    "color": discord.Color.orange().value,
+}
+_ACTION_NOT_IMPLEMENTED_EMBED = {
+    "type": "rich",
+    "title": "Not Implemented",
+    "description": "Action submission will be implemented in a future update.",
+    "color": discord.Color.orange().value,
+}
+
 
 def setup_gameplay_commands(bot: DiscordBot) -> None:
     """
@@ -32,13 +46,8 @@ def setup_gameplay_commands(bot: DiscordBot) -> None:
         reason: str | None = None,
     ) -> None:
         """Roll dice."""
-        await interaction.response.defer(ephemeral=False)
-        embed = discord.Embed(
-            title="Not Implemented",
-            description="Dice rolling will be implemented in a future update.",
-            color=discord.Color.orange(),
-        )
-        await interaction.followup.send(embed=embed)
+        embed = discord.Embed.from_dict(_ROLL_NOT_IMPLEMENTED_EMBED)
+        await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="r", description="Quick roll alias")
     @app_commands.describe(expression="Dice expression")
@@ -47,13 +56,8 @@ def setup_gameplay_commands(bot: DiscordBot) -> None:
         expression: str,
     ) -> None:
         """Quick roll alias."""
-        await interaction.response.defer(ephemeral=False)
-        embed = discord.Embed(
-            title="Not Implemented",
-            description="Dice rolling will be implemented in a future update.",
-            color=discord.Color.orange(),
-        )
-        await interaction.followup.send(embed=embed)
+        embed = discord.Embed.from_dict(_ROLL_NOT_IMPLEMENTED_EMBED)
+        await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="action", description="Submit narrative action")
     @app_commands.describe(description="Action description")
@@ -62,13 +66,8 @@ def setup_gameplay_commands(bot: DiscordBot) -> None:
         description: str,
     ) -> None:
         """Submit narrative action."""
-        await interaction.response.defer(ephemeral=True)
-        embed = discord.Embed(
-            title="Not Implemented",
-            description="Action submission will be implemented in a future update.",
-            color=discord.Color.orange(),
-        )
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed.from_dict(_ACTION_NOT_IMPLEMENTED_EMBED)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     bot.tree.add_command(roll_group)
     bot.tree.add_command(quick_roll)
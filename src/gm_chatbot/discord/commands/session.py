@@ -9,6 +9,14 @@ from ..bot import DiscordBot
 
 logger = logging.getLogger(__name__)
 
+# Static placeholder embed shared by the unimplemented session commands
+_NOT_IMPLEMENTED_EMBED = {
+    "type": "rich",
+    "title": "Not Implemented",
+    "description": "Session management will be implemented in a future update.",
+    "color": discord.Color.orange().value,
+}
+
 
 def setup_session_commands(bot: DiscordBot) -> None:
     """
@@ -29,34 +37,19 @@ def setup_session_commands(bot: DiscordBot) -> None:
         name: str | None = None,
     ) -> None:
         """Start a new session."""
-        await interaction.response.defer(ephemeral=True)
-        embed = discord.Embed(
-            title="Not Implemented",
-            description="Session management will be implemented in a future update.",
-            color=discord.Color.orange(),
-        )
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed.from_dict(_NOT_IMPLEMENTED_EMBED)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @session_group.command(name="end", description="End current session")
     async def end_session(interaction: discord.Interaction) -> None:
         """End current session."""
-        await interaction.response.defer(ephemeral=True)
-        embed = discord.Embed(
-            title="Not Implemented",
-            description="Session management will be implemented in a future update.",
-            color=discord.Color.orange(),
-        )
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed.from_dict(_NOT_IMPLEMENTED_EMBED)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @session_group.command(name="status", description="Show session status")
     async def session_status(interaction: discord.Interaction) -> None:
         """Show session status."""
-        await interaction.response.defer(ephemeral=True)
-        embed = discord.Embed(
-            title="Not Implemented",
-            description="Session management will be implemented in a future update.",
-            color=discord.Color.orange(),
-        )
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed.from_dict(_NOT_IMPLEMENTED_EMBED)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     bot.tree.add_command(session_group)
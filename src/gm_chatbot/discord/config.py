@@ -1,7 +1,8 @@
 """Discord bot configuration."""
 
+import functools
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -20,11 +21,29 @@ class DiscordConfig:
         60,
     )  # 100 API calls per 60 seconds
 
+    # Scalar views of the rate-limit tuples, derived in __post_init__
+    commands_limit: int = field(init=False)
+    commands_window: int = field(init=False)
+    messages_limit: int = field(init=False)
+    messages_window: int = field(init=False)
+    api_calls_limit: int = field(init=False)
+    api_calls_window: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Unpack rate-limit tuples into scalar attributes."""
+        self.commands_limit, self.commands_window = self.rate_limit_commands_per_user
+        self.messages_limit, self.messages_window = self.rate_limit_messages_per_channel
+        self.api_calls_limit, self.api_calls_window = self.rate_limit_api_calls_per_guild
+
     @classmethod
+    @functools.cache
     def from_env(cls) -> "DiscordConfig":
         """
         Create Discord config from environment variables.
 
+        The result is cached; call ``DiscordConfig.from_env.cache_clear()``
+        to re-read the environment.
+
         Returns:
             DiscordConfig instance
 
@@ -39,4 +39,5 @@ async def handle_message_event(
     # Skip if message doesn't mention bot or isn't in a bound channel
     # This will be implemented when chat integration is added
     # For now, this is a placeholder
-    logger.debug(f"Message received: {message.content[:50]}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Message received: %s", message.content[:50])
@@ -12,6 +12,18 @@ logger = logging.getLogger(__name__)
 
 _bot_task: asyncio.Task | None = None
 _bot: DiscordBot | None = None
+# Whether the bot's store was created here and must be closed on stop
+_owns_store = False
+
+# Command registration functions; they only add commands to the tree,
+# which DiscordBot.setup_hook syncs once at login
+_SETUPS = (
+    campaign.setup_campaign_commands,
+    character.setup_character_commands,
+    session.setup_session_commands,
+    gameplay.setup_gameplay_commands,
+    admin.setup_admin_commands,
+)
 
 
 async def start_discord_bot(
@@ -21,11 +33,15 @@ async def start_discord_bot(
     """
     Start Discord bot.
 
+    Nothing is awaited between the already-started check and assigning
+    the new bot, so concurrent callers on the event loop cannot both
+    create a bot.
+
     Args:
         config: Optional Discord config (creates from env if not provided)
         store: Optional artifact store
     """
-    global _bot, _bot_task
+    global _bot, _bot_task, _owns_store
 
     if _bot is not None:
         logger.warning("Discord bot already started")
@@ -36,13 +52,11 @@ async def start_discord_bot(
 
     # Create bot
     _bot = DiscordBot(config, store)
+    _owns_store = store is None
 
     # Register commands
-    campaign.setup_campaign_commands(_bot)
-    character.setup_character_commands(_bot)
-    session.setup_session_commands(_bot)
-    gameplay.setup_gameplay_commands(_bot)
-    admin.setup_admin_commands(_bot)
+    for setup in _SETUPS:
+        setup(_bot)
 
     # Start bot in background
     async def run_bot():
@@ -58,21 +72,29 @@ async def start_discord_bot(
 
 async def stop_discord_bot() -> None:
     """Stop Discord bot."""
-    global _bot, _bot_task
+    global _bot, _bot_task, _owns_store
 
     if _bot is None:
         return
 
     logger.info("Stopping Discord bot...")
     await _bot.close()
+    store = _bot.store if _owns_store else None
     _bot = None
+    _owns_store = False
 
     if _bot_task:
-        _bot_task.cancel()
-        try:
-            await _bot_task
-        except asyncio.CancelledError:
-            pass
+        if not _bot_task.done():
+            _bot_task.cancel()
+            try:
+                await _bot_task
+            except asyncio.CancelledError:
+                pass
+        elif not _bot_task.cancelled():
+            # Already finished (close() ended start()); any error was logged by run_bot
+            _bot_task.exception()
         _bot_task = None
 
+    if store is not None:
+        store.close()
     logger.info("Discord bot stopped")
@@ -6,6 +6,9 @@ import discord
 
 logger = logging.getLogger(__name__)
 
+# Static part of the error embed; only the description varies per call
+_ERROR_TEMPLATE = {"type": "rich", "title": "Error", "color": discord.Color.red().value}
+
 
 async def handle_command_error(
     interaction: discord.Interaction,
@@ -20,13 +23,13 @@ async def handle_command_error(
         error: Exception that occurred
         ephemeral: Whether message should be ephemeral
     """
-    logger.error(f"Error in command: {error}", exc_info=True)
+    # Stringify once for both the log record and the embed
+    err_text = str(error)
+    logger.error("Error in command: %s", err_text, exc_info=True)
 
     # Create error embed
-    embed = discord.Embed(
-        title="Error",
-        description=f"An error occurred: {error!s}",
-        color=discord.Color.red(),
+    embed = discord.Embed.from_dict(
+        {**_ERROR_TEMPLATE, "description": f"An error occurred: {err_text}"}
     )
 
     # Send error message
@@ -36,4 +39,4 @@ async def handle_command_error(
         else:
             await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
     except Exception as e:
-        logger.error(f"Failed to send error message: {e}", exc_info=True)
+        logger.error("Failed to send error message: %s", e, exc_info=True)
@@ -1,17 +1,46 @@
 """Rate limiting for Discord commands."""
 
 import time
-from collections import defaultdict
+from collections import OrderedDict
+
+NANOSECONDS = 1_000_000_000
 
 
 class RateLimiter:
-    """Rate limiter for Discord commands."""
+    """
+    Rate limiter for Discord commands.
+
+    Windows are measured against time.monotonic(), so wall-clock
+    adjustments never admit or reject requests spuriously. TAT values are
+    kept in integer nanoseconds so float rounding cannot build up across a
+    burst, and are only meaningful within the running process.
+
+    The check_* methods are deliberately synchronous: reading and updating
+    a key's TAT happens without yielding to the event loop, so concurrent
+    command coroutines cannot interleave between the check and the record.
+    Keep them free of awaits; the limiter is not meant to be shared
+    across threads.
+    """
+
+    __slots__ = (
+        "_api_call_rate",
+        "_command_rate",
+        "_message_rate",
+        "api_calls_per_guild",
+        "channel_messages",
+        "commands_per_user",
+        "guild_api_calls",
+        "max_keys",
+        "messages_per_channel",
+        "user_commands",
+    )
 
     def __init__(
         self,
         commands_per_user: tuple[int, int] = (20, 60),
         messages_per_channel: tuple[int, int] = (30, 60),
         api_calls_per_guild: tuple[int, int] = (100, 60),
+        max_keys: int = 100_000,
     ):
         """
         Initialize rate limiter.
@@ -20,88 +49,120 @@ class RateLimiter:
             commands_per_user: (limit, window_seconds) for commands per user
             messages_per_channel: (limit, window_seconds) for messages per channel
             api_calls_per_guild: (limit, window_seconds) for API calls per guild
+            max_keys: Maximum keys tracked per limit; least recently used
+                keys are dropped beyond this
         """
         self.commands_per_user = commands_per_user
         self.messages_per_channel = messages_per_channel
         self.api_calls_per_guild = api_calls_per_guild
+        self.max_keys = max_keys
+
+        # GCRA parameters: (emission interval, burst tolerance) in nanoseconds
+        self._command_rate = self._gcra_params(commands_per_user)
+        self._message_rate = self._gcra_params(messages_per_channel)
+        self._api_call_rate = self._gcra_params(api_calls_per_guild)
 
-        # Track usage
-        self.user_commands: dict[str, list[float]] = defaultdict(list)
-        self.channel_messages: dict[str, list[float]] = defaultdict(list)
-        self.guild_api_calls: dict[str, list[float]] = defaultdict(list)
+        # Track usage as each key's theoretical arrival time (TAT), in LRU order
+        self.user_commands: OrderedDict[str, int] = OrderedDict()
+        self.channel_messages: OrderedDict[str, int] = OrderedDict()
+        self.guild_api_calls: OrderedDict[str, int] = OrderedDict()
 
-    def check_user_command(self, user_id: str) -> bool:
+    def check_user_command(self, user_id: str, now: float | None = None) -> bool:
         """
         Check if user can execute a command.
 
         Args:
             user_id: User ID
+            now: Optional time.monotonic() reading to reuse across checks
 
         Returns:
             True if allowed, False if rate limited
         """
-        limit, window = self.commands_per_user
-        now = time.time()
-
-        # Clean old entries
-        self.user_commands[user_id] = [t for t in self.user_commands[user_id] if now - t < window]
-
-        # Check limit
-        if len(self.user_commands[user_id]) >= limit:
-            return False
-
-        # Record command
-        self.user_commands[user_id].append(now)
-        return True
+        if now is None:
+            now = time.monotonic()
+        return self._check(self.user_commands, user_id, *self._command_rate, now)
 
-    def check_channel_message(self, channel_id: str) -> bool:
+    def check_channel_message(self, channel_id: str, now: float | None = None) -> bool:
         """
         Check if channel can receive a message.
 
         Args:
             channel_id: Channel ID
+            now: Optional time.monotonic() reading to reuse across checks
 
         Returns:
             True if allowed, False if rate limited
         """
-        limit, window = self.messages_per_channel
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
+        return self._check(self.channel_messages, channel_id, *self._message_rate, now)
 
-        # Clean old entries
-        self.channel_messages[channel_id] = [
-            t for t in self.channel_messages[channel_id] if now - t < window
-        ]
-
-        # Check limit
-        if len(self.channel_messages[channel_id]) >= limit:
-            return False
-
-        # Record message
-        self.channel_messages[channel_id].append(now)
-        return True
-
-    def check_guild_api_call(self, guild_id: str) -> bool:
+    def check_guild_api_call(self, guild_id: str, now: float | None = None) -> bool:
         """
         Check if guild can make an API call.
 
         Args:
             guild_id: Guild ID
+            now: Optional time.monotonic() reading to reuse across checks
 
         Returns:
             True if allowed, False if rate limited
         """
-        limit, window = self.api_calls_per_guild
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
+        return self._check(self.guild_api_calls, guild_id, *self._api_call_rate, now)
 
-        # Clean old entries
-        self.guild_api_calls[guild_id] = [
-            t for t in self.guild_api_calls[guild_id] if now - t < window
-        ]
+    @staticmethod
+    def _gcra_params(rate: tuple[int, int]) -> tuple[int, int]:
+        """
+        Convert a (limit, window_seconds) rate into GCRA parameters.
 
-        # Check limit
-        if len(self.guild_api_calls[guild_id]) >= limit:
+        Args:
+            rate: (limit, window_seconds)
+
+        Returns:
+            (emission interval, burst tolerance) in nanoseconds; the
+            tolerance lets a full window's worth of requests through in a
+            burst, and the interval is rounded down so it always does
+        """
+        limit, window = rate
+        burst = window * NANOSECONDS
+        return burst // limit, burst
+
+    def _check(
+        self,
+        tats: OrderedDict[str, int],
+        key: str,
+        interval: int,
+        burst: int,
+        now: float,
+    ) -> bool:
+        """
+        Apply a GCRA (generic cell rate algorithm) check and record the request if allowed.
+
+        Each allowed request pushes the key's theoretical arrival time one
+        emission interval further out; a request is rejected when that
+        would put the TAT more than the burst tolerance ahead of now. Keys
+        are kept in LRU order and the least recently used key is dropped
+        once more than max_keys are tracked.
+
+        Args:
+            tats: Theoretical arrival time per key
+            key: Key being limited
+            interval: Emission interval (window / limit) in nanoseconds
+            burst: Burst tolerance in nanoseconds
+            now: Current time in seconds
+
+        Returns:
+            True if allowed, False if rate limited
+        """
+        now_ns = round(now * NANOSECONDS)
+        tat = max(tats.get(key, now_ns), now_ns) + interval
+        if tat - now_ns > burst:
             return False
 
-        # Record API call
-        self.guild_api_calls[guild_id].append(now)
+        tats[key] = tat
+        tats.move_to_end(key)
+        if len(tats) > self.max_keys:
+            tats.popitem(last=False)
         return True
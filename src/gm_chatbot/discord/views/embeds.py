@@ -1,11 +1,50 @@
 """Discord embed builders."""
 
+from collections.abc import Iterable
+from typing import Any
+
 import discord
 
 from ...models.campaign import Campaign
 from ...models.character import CharacterSheet
 from ...models.session import Session
 
+# Shared embed colors, created once at import
+_BLUE = discord.Color.blue()
+_GREEN = discord.Color.green()
+_PURPLE = discord.Color.purple()
+_GOLD = discord.Color.gold()
+_RED = discord.Color.red()
+
+
+def _make_embed(
+    title: str,
+    color: discord.Color,
+    description: str | None = None,
+    fields: Iterable[tuple[str, Any, bool]] = (),
+) -> discord.Embed:
+    """
+    Build an embed in one pass from its parts.
+
+    Args:
+        title: Embed title
+        color: Embed color
+        description: Optional embed description
+        fields: (name, value, inline) tuples; values are converted to str
+
+    Returns:
+        Discord embed
+    """
+    payload: dict[str, Any] = {"type": "rich", "title": title, "color": color.value}
+    if description is not None:
+        payload["description"] = description
+    field_dicts = [
+        {"name": name, "value": str(value), "inline": inline} for name, value, inline in fields
+    ]
+    if field_dicts:
+        payload["fields"] = field_dicts
+    return discord.Embed.from_dict(payload)
+
 
 def build_campaign_embed(campaign: Campaign) -> discord.Embed:
     """
@@ -17,15 +56,16 @@ def build_campaign_embed(campaign: Campaign) -> discord.Embed:
     Returns:
         Discord embed
     """
-    embed = discord.Embed(
-        title=campaign.name,
+    return _make_embed(
+        campaign.name,
+        _BLUE,
         description=campaign.description or "No description",
-        color=discord.Color.blue(),
+        fields=(
+            ("Campaign ID", campaign.metadata.id, False),
+            ("System", campaign.rule_system, True),
+            ("Status", campaign.status, True),
+        ),
     )
-    embed.add_field(name="Campaign ID", value=campaign.metadata.id, inline=False)
-    embed.add_field(name="System", value=campaign.rule_system, inline=True)
-    embed.add_field(name="Status", value=campaign.status, inline=True)
-    return embed
 
 
 def build_character_sheet_embed(character: CharacterSheet) -> discord.Embed:
@@ -38,14 +78,14 @@ def build_character_sheet_embed(character: CharacterSheet) -> discord.Embed:
     Returns:
         Discord embed
     """
-    embed = discord.Embed(
-        title=character.identity.name if character.identity else "Unknown Character",
-        color=discord.Color.green(),
-    )
+    if not character.identity:
+        return _make_embed("Unknown Character", _GREEN)
     # Add character details
-    if character.identity:
-        embed.add_field(name="Name", value=character.identity.name, inline=True)
-    return embed
+    return _make_embed(
+        character.identity.name,
+        _GREEN,
+        fields=(("Name", character.identity.name, True),),
+    )
 
 
 def build_session_status_embed(session: Session) -> discord.Embed:
@@ -58,18 +98,19 @@ def build_session_status_embed(session: Session) -> discord.Embed:
     Returns:
         Discord embed
     """
-    embed = discord.Embed(
-        title=f"Session {session.session_number}",
+    return _make_embed(
+        f"Session {session.session_number}",
+        _PURPLE,
         description=session.name or "No name",
-        color=discord.Color.purple(),
-    )
-    embed.add_field(name="Status", value=session.status, inline=True)
-    embed.add_field(
-        name="Started",
-        value=session.started_at.isoformat() if session.started_at else "Unknown",
-        inline=True,
+        fields=(
+            ("Status", session.status, True),
+            (
+                "Started",
+                session.started_at.isoformat() if session.started_at else "Unknown",
+                True,
+            ),
+        ),
     )
-    return embed
 
 
 def build_dice_roll_embed(roll_result: dict, user: str, reason: str | None = None) -> discord.Embed:
@@ -84,14 +125,12 @@ def build_dice_roll_embed(roll_result: dict, user: str, reason: str | None = Non
     Returns:
         Discord embed
     """
-    embed = discord.Embed(
-        title="Dice Roll",
+    return _make_embed(
+        "Dice Roll",
+        _GOLD,
         description=f"{user} rolled: {roll_result.get('result', 'N/A')}",
-        color=discord.Color.gold(),
+        fields=(("Reason", reason, False),) if reason else (),
     )
-    if reason:
-        embed.add_field(name="Reason", value=reason, inline=False)
-    return embed
 
 
 def build_error_embed(error_message: str) -> discord.Embed:
@@ -104,8 +143,4 @@ def build_error_embed(error_message: str) -> discord.Embed:
     Returns:
         Discord embed
     """
-    return discord.Embed(
-        title="Error",
-        description=error_message,
-        color=discord.Color.red(),
-    )
+    return _make_embed("Error", _RED, description=error_message)
@@ -1,5 +1,7 @@
 """Discord pagination system."""
 
+from collections.abc import Callable
+
 import discord
 from discord.ui import Button, View
 
@@ -7,32 +9,60 @@ from discord.ui import Button, View
 class PaginatedView(View):
     """Paginated view for long embeds."""
 
-    def __init__(self, pages: list[discord.Embed], timeout: int = 300):
+    def __init__(self, page_factories: list[Callable[[], discord.Embed]], timeout: int = 300):
         """
         Initialize paginated view.
 
+        Pages are built on first display and cached, so pages the user
+        never visits are never constructed. Callers that already hold
+        embeds can pass ``[lambda e=e: e for e in embeds]``.
+
         Args:
-            pages: List of embeds (pages)
+            page_factories: Callables that build each page's embed
             timeout: View timeout in seconds
         """
         super().__init__(timeout=timeout)
-        self.pages = pages
+        self._factories = page_factories
+        self._cache: dict[int, discord.Embed] = {}
         self.current_page = 0
+        self._refresh_buttons()
+
+    def get_page(self, index: int) -> discord.Embed:
+        """
+        Get a page's embed, building it on first access.
+
+        Args:
+            index: Page index
+
+        Returns:
+            Embed for the page
+        """
+        page = self._cache.get(index)
+        if page is None:
+            page = self._cache[index] = self._factories[index]()
+        return page
+
+    def _refresh_buttons(self) -> None:
+        """Disable navigation buttons that would move past the first or last page."""
+        self.previous_page.disabled = self.current_page == 0
+        self.next_page.disabled = self.current_page >= len(self._factories) - 1
 
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
     async def previous_page(self, interaction: discord.Interaction, button: Button) -> None:
         """Go to previous page."""
-        if self.current_page > 0:
-            self.current_page -= 1
-            await interaction.response.edit_message(embed=self.pages[self.current_page], view=self)
-        else:
-            await interaction.response.defer()
+        # Acknowledge first so building the page cannot miss the 3s deadline
+        await interaction.response.defer()
+        # The button is disabled on the first page; clamp for stale messages
+        self.current_page = max(self.current_page - 1, 0)
+        self._refresh_buttons()
+        await interaction.edit_original_response(embed=self.get_page(self.current_page), view=self)
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
     async def next_page(self, interaction: discord.Interaction, button: Button) -> None:
         """Go to next page."""
-        if self.current_page < len(self.pages) - 1:
-            self.current_page += 1
-            await interaction.response.edit_message(embed=self.pages[self.current_page], view=self)
-        else:
-            await interaction.response.defer()
+        # Acknowledge first so building the page cannot miss the 3s deadline
+        await interaction.response.defer()
+        # The button is disabled on the last page; clamp for stale messages
+        self.current_page = min(self.current_page + 1, len(self._factories) - 1)
+        self._refresh_buttons()
+        await interaction.edit_original_response(embed=self.get_page(self.current_page), view=self)
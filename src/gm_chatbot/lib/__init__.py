@@ -1,7 +1,7 @@
 """Centralized utility library for GM Chatbot.
 
 This module provides reusable utilities for datetime handling, type definitions,
-and common patterns used across the codebase.
+YAML loading, and common patterns used across the codebase.
 """
 
 from .datetime import ensure_utc, format_datetime, parse_datetime, utc_now
@@ -17,6 +17,7 @@ from .types import (
     SessionStatus,
     SlugStr,
 )
+from .yaml import SafeDumper, SafeLoader
 
 __all__ = [
     "UTC_DATETIME",
@@ -27,6 +28,8 @@ __all__ = [
     "NonEmptyStr",
     "PlayerStatus",
     "PositiveInt",
+    "SafeDumper",
+    "SafeLoader",
     "SessionStatus",
     "SlugStr",
     "ensure_utc",
@@ -4,6 +4,7 @@ All functions in this module assume and enforce UTC timezone to avoid
 timezone-related bugs. All functions handle None gracefully for optional fields.
 """
 
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import overload
 
@@ -46,7 +47,12 @@ def ensure_utc(dt: datetime | None) -> datetime | None:
     if dt is None:
         return None
 
-    if dt.tzinfo is None:
+    tzinfo = dt.tzinfo
+    if tzinfo is UTC:
+        # Already UTC; skip the astimezone copy
+        return dt
+
+    if tzinfo is None:
         # Naive datetime - assume UTC
         return dt.replace(tzinfo=UTC)
 
@@ -104,24 +110,19 @@ def parse_datetime(value: str | datetime | None) -> datetime | None:
     if not isinstance(value, str):
         raise TypeError(f"Expected str, datetime, or None, got {type(value)}")
 
-    # Try parsing ISO format with Z suffix
-    if value.endswith("Z"):
-        # Replace Z with +00:00 for Python compatibility
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except ValueError:
-            # Fallback: try without Z
-            return datetime.fromisoformat(value[:-1]).replace(tzinfo=UTC)
-
-    # Try parsing as ISO format
+    # fromisoformat accepts the "Z" suffix natively (Python 3.11+)
     try:
         dt = datetime.fromisoformat(value)
-        # If naive, assume UTC
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=UTC)
-        return dt
     except ValueError as e:
-        raise ValueError(f"Could not parse datetime string: {value}") from e
+        if not value.endswith("Z"):
+            raise ValueError(f"Could not parse datetime string: {value}") from e
+        # Fallback: drop a Z that fromisoformat rejects and force UTC
+        return datetime.fromisoformat(value[:-1]).replace(tzinfo=UTC)
+
+    # If naive, assume UTC
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    return dt
 
 
 def format_datetime(dt: datetime | None, fmt: str = "iso") -> str | None:
@@ -152,12 +153,38 @@ def format_datetime(dt: datetime | None, fmt: str = "iso") -> str | None:
     if dt_utc is None:
         return None
 
-    if fmt == "iso":
-        # ISO 8601 with Z suffix
-        return dt_utc.strftime("%Y-%m-%dT%H:%M:%S.%fZ").replace(".000000", "")
-    elif fmt == "human":
-        return dt_utc.strftime("%Y-%m-%d %H:%M:%S UTC")
-    elif fmt == "date":
-        return dt_utc.strftime("%Y-%m-%d")
-    else:
+    formatter = _FORMATTERS.get(fmt)
+    if formatter is None:
         raise ValueError(f"Unknown format: {fmt}")
+    return formatter(dt_utc)
+
+
+def _format_iso(dt: datetime) -> str:
+    """Format as ISO 8601 with Z suffix, adding microseconds only if nonzero."""
+    base = (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+    if dt.microsecond:
+        return f"{base}.{dt.microsecond:06d}Z"
+    return f"{base}Z"
+
+
+def _format_human(dt: datetime) -> str:
+    """Format as a human-readable UTC timestamp."""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} UTC"
+    )
+
+
+def _format_date(dt: datetime) -> str:
+    """Format as date only (YYYY-MM-DD)."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+# format_datetime presets; f-strings avoid strftime's format parsing
+_FORMATTERS: dict[str, Callable[[datetime], str]] = {
+    "iso": _format_iso,
+    "human": _format_human,
+    "date": _format_date,
+}
@@ -5,11 +5,13 @@ consistent validation rules and reduce duplication.
 """
 
 import re
+import string
+import sys
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Annotated
 
-from pydantic import BeforeValidator, Field
+from pydantic import AfterValidator, BeforeValidator, Field
 
 # ============================================================================
 # Datetime Types
@@ -20,7 +22,11 @@ def _ensure_utc_validator(v: datetime | None) -> datetime | None:
     """Validator to ensure datetime is in UTC."""
     if v is None:
         return None
-    if v.tzinfo is None:
+    tzinfo = v.tzinfo
+    if tzinfo is UTC:
+        # Already UTC (e.g. from utc_now()); skip the astimezone copy
+        return v
+    if tzinfo is None:
         return v.replace(tzinfo=UTC)
     return v.astimezone(UTC)
 
@@ -54,6 +60,19 @@ NonEmptyStr = Annotated[
 ]
 
 
+# Low-cardinality labels repeated across many artifacts (rule systems,
+# action types) share one str object per distinct value
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Translation table deleting every allowed entity ID character; any
+# character left over after translate() is invalid
+_ENTITY_ID_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
+
+# Patterns used by the slug validator, compiled once at import
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_COLLAPSE_RE = re.compile(r"[-\s]+")
+
+
 def _validate_entity_id(v: str) -> str:
     """Validate entity ID format."""
     if not isinstance(v, str):
@@ -63,7 +82,7 @@ def _validate_entity_id(v: str) -> str:
     if len(v) > 64:
         raise ValueError("Entity ID cannot exceed 64 characters")
     # Alphanumeric, underscore, hyphen
-    if not re.match(r"^[a-zA-Z0-9_-]+$", v):
+    if v.translate(_ENTITY_ID_DELETE):
         raise ValueError(
             "Entity ID can only contain alphanumeric characters, underscores, and hyphens"
         )
@@ -82,8 +101,8 @@ def _validate_slug(v: str) -> str:
     if not isinstance(v, str):
         raise ValueError("Expected string")
     # Convert to lowercase and replace spaces/spaces with hyphens
-    slug = re.sub(r"[^\w\s-]", "", v.lower())
-    slug = re.sub(r"[-\s]+", "-", slug)
+    slug = _SLUG_STRIP_RE.sub("", v.lower())
+    slug = _SLUG_COLLAPSE_RE.sub("-", slug)
     slug = slug.strip("-")
     if not slug:
         raise ValueError("Slug cannot be empty")
@@ -111,6 +130,9 @@ PositiveInt = Annotated[
 # Status Enums
 # ============================================================================
 
+# Artifact models are strict, so fields using these enums set strict=False
+# to let pydantic-core coerce stored string values to members.
+
 
 class CampaignStatus(StrEnum):
     """Campaign status enumeration."""
@@ -0,0 +1,15 @@
+"""YAML loader and dumper selection.
+
+PyYAML's libyaml-backed C classes are many times faster than the
+pure-Python ones but are only present when PyYAML was built against
+libyaml (the published wheels are). Both variants accept and emit the
+same safe subset of YAML.
+"""
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+__all__ = ["SafeDumper", "SafeLoader"]
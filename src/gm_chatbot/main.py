@@ -109,6 +109,7 @@ except Exception as e:
 # #endregion
 
 from .api.app import create_app
+from .api.dependencies import close_dependencies
 from .discord.startup import start_discord_bot, stop_discord_bot
 
 logging.basicConfig(level=logging.INFO)
@@ -135,6 +136,7 @@ async def startup_event():
 async def shutdown_event():
     """Shutdown event handler."""
     await stop_discord_bot()
+    close_dependencies()
     logger.info("Application shutdown complete")
 
 
@@ -6,7 +6,7 @@ from .campaign import Campaign
 from .character import CharacterSheet
 from .chat import APIResponse, ChatMessage, ErrorDetail, ResponseMeta
 from .dice import DiceResult
-from .discord_binding import DiscordBinding
+from .discord_binding import BindingSettings, DiscordBinding
 from .discord_link import DiscordLink, GuildInfo
 from .membership import CampaignMembership
 from .player import Player
@@ -21,6 +21,7 @@ __all__ = [
     "ActionOutcome",
     "ArtifactMetadata",
     "BaseArtifact",
+    "BindingSettings",
     "Campaign",
     "CampaignMembership",
     "CharacterSheet",
@@ -1,12 +1,14 @@
 """Game action models."""
 
+import secrets
 from datetime import datetime
+from functools import partial
 from typing import Literal
-from uuid import uuid4
 
 from pydantic import Field
 
 from ..lib.datetime import utc_now
+from ..lib.types import InternedStr
 from .base import BaseModel
 from .dice import DiceResult
 
@@ -32,11 +34,11 @@ class ActionOutcome(BaseModel):
 class GameAction(BaseModel):
     """A discrete game event that transitions game state."""
 
-    action_id: str = Field(default_factory=lambda: str(uuid4()))
+    action_id: str = Field(default_factory=partial(secrets.token_hex, 16))
     timestamp: datetime = Field(default_factory=utc_now)
     actor_id: str  # Character or GM identifier
     actor_type: Literal["player", "gm"]
-    action_type: str  # "attack", "move", "cast_spell", etc.
+    action_type: InternedStr  # "attack", "move", "cast_spell", etc.
     target_ids: list[str] = Field(default_factory=list)
     parameters: dict = Field(default_factory=dict)  # Action-specific parameters
     dice_results: list[DiceResult] = Field(default_factory=list)
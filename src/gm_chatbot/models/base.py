@@ -1,24 +1,33 @@
 """Base models for all artifacts."""
 
-from typing import TYPE_CHECKING, Any, TypeVar
-from uuid import uuid4
+import re
+import secrets
+import types
+from enum import Enum
+from functools import partial
+from typing import TYPE_CHECKING, Annotated, Any, TypeVar, Union, get_args, get_origin
 
 import yaml
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from ..lib.datetime import parse_datetime, utc_now
 from ..lib.types import UTC_DATETIME
+from ..lib.yaml import SafeDumper, SafeLoader
 
 if TYPE_CHECKING:
     T = TypeVar("T", bound="BaseArtifact")
 else:
     T = TypeVar("T")
 
+# Prefix of an ISO datetime (YYYY-MM-DDTHH:MM); only strings matching it
+# are handed to parse_datetime, so ordinary text never raises
+_ISO_DT_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}")
+
 
 class ArtifactMetadata(BaseModel):
     """Metadata for all artifacts."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=partial(secrets.token_hex, 16))
     created_at: UTC_DATETIME = Field(default_factory=utc_now)
     updated_at: UTC_DATETIME = Field(default_factory=utc_now)
     version: int = Field(default=1, ge=1)
@@ -36,10 +45,27 @@ class BaseArtifact(BaseModel):
 
     metadata: ArtifactMetadata = Field(default_factory=ArtifactMetadata)
 
+    # Stat key of the stored file this instance was loaded from or saved to
+    _source_key: tuple[int, int, int] | None = PrivateAttr(default=None)
+
+    @property
+    def source_key(self) -> tuple[int, int, int] | None:
+        """
+        Identify the stored file contents this artifact matches.
+
+        Set by ArtifactStore on load and save; any later write to the file
+        changes its inode, mtime or size, so the key changes with it.
+
+        Returns:
+            (inode, mtime_ns, size) of the file, or None if never stored
+        """
+        return self._source_key
+
     def to_yaml(self) -> str:
         """Serialize to YAML string."""
-        return yaml.safe_dump(
+        return yaml.dump(
             self.model_dump(mode="json"),
+            Dumper=SafeDumper,
             default_flow_style=False,
             allow_unicode=True,
             sort_keys=False,
@@ -48,26 +74,123 @@ class BaseArtifact(BaseModel):
     @classmethod
     def from_yaml(cls: type[T], content: str) -> T:
         """Deserialize from YAML string."""
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=SafeLoader)
         if data is None:
             raise ValueError("YAML content is empty")
         # Convert datetime strings back to datetime objects for Pydantic v2 strict mode
         data = cls._parse_datetime_strings(data)
         return cls.model_validate(data)
 
+    @classmethod
+    def from_yaml_trusted(cls: type[T], content: str) -> T:
+        """
+        Deserialize YAML this process wrote itself, skipping validation.
+
+        Only use this for content produced by to_yaml() in this process;
+        anything that may have been edited by hand must go through
+        from_yaml().
+
+        Args:
+            content: YAML produced by to_yaml()
+
+        Returns:
+            Artifact built with model_construct()
+
+        Raises:
+            ValueError: If content is empty
+        """
+        data = yaml.load(content, Loader=SafeLoader)
+        if data is None:
+            raise ValueError("YAML content is empty")
+        data = cls._parse_datetime_strings(data)
+        return _construct_value(cls, data)
+
     @staticmethod
     def _parse_datetime_strings(obj: Any) -> Any:
-        """Recursively parse datetime strings in dict/list structures."""
-        if isinstance(obj, dict):
-            return {k: BaseArtifact._parse_datetime_strings(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [BaseArtifact._parse_datetime_strings(item) for item in obj]
-        elif isinstance(obj, str) and "T" in obj and len(obj) > 10:
-            # Try to parse ISO format datetime strings
-            # Look for ISO datetime pattern: YYYY-MM-DDTHH:MM:SS...
+        """
+        Parse datetime strings in dict/list structures.
+
+        Walks the structure with an explicit stack and replaces matching
+        strings in place, so nested containers are not rebuilt. Callers
+        must pass data they own, such as a fresh yaml.load() result.
+
+        Args:
+            obj: Loaded YAML data
+
+        Returns:
+            The same data with ISO datetime strings converted to datetimes
+        """
+        if not isinstance(obj, dict | list):
+            return BaseArtifact._maybe_parse_datetime(obj)
+
+        stack: list[dict | list] = [obj]
+        while stack:
+            container = stack.pop()
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                if isinstance(value, dict | list):
+                    stack.append(value)
+                elif isinstance(value, str):
+                    parsed = BaseArtifact._maybe_parse_datetime(value)
+                    if parsed is not value:
+                        # Replacing a value does not change the keys, so
+                        # this is safe while iterating
+                        container[key] = parsed
+        return obj
+
+    @staticmethod
+    def _maybe_parse_datetime(value: Any) -> Any:
+        """Return value parsed as a datetime if it looks like an ISO datetime string."""
+        if isinstance(value, str) and len(value) >= 16 and _ISO_DT_RE.match(value):
             try:
-                return parse_datetime(obj)
-            except (ValueError, TypeError):
-                # Not a datetime string, return as-is
+                return parse_datetime(value)
+            except ValueError:
+                # Datetime-like prefix but not a valid datetime; keep as-is
                 pass
-        return obj
+        return value
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """
+    Build a trusted value for a field annotation without validating it.
+
+    Nested models are built with model_construct() and enum values are
+    converted to members; everything else is returned as loaded.
+
+    Args:
+        annotation: Field annotation
+        value: Loaded YAML value
+
+    Returns:
+        Value shaped like model_validate() would produce it
+    """
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _construct_value(get_args(annotation)[0], value)
+    if origin is Union or origin is types.UnionType:
+        # Optional[X] / X | None: use the first arm that is not None
+        arms = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _construct_value(arms[0], value) if len(arms) == 1 else value
+    if origin is list and isinstance(value, list):
+        (item_type,) = get_args(annotation) or (Any,)
+        return [_construct_value(item_type, item) for item in value]
+    if origin is dict and isinstance(value, dict):
+        _, item_type = get_args(annotation) or (Any, Any)
+        return {k: _construct_value(item_type, v) for k, v in value.items()}
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel) and isinstance(value, dict):
+            # Match model_validate(): aliased fields only accept their field
+            # name when the model allows population by name
+            by_name = annotation.model_config.get("populate_by_name", False)
+            fields = {}
+            for name, field in annotation.model_fields.items():
+                if field.alias in value:
+                    fields[name] = _construct_value(field.annotation, value[field.alias])
+                elif (field.alias is None or by_name) and name in value:
+                    fields[name] = _construct_value(field.annotation, value[name])
+            return annotation.model_construct(**fields)
+        if issubclass(annotation, Enum):
+            return annotation(value)
+    return value
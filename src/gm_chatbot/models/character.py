@@ -1,8 +1,6 @@
 """Character sheet model."""
 
-from typing import Annotated
-
-from pydantic import BaseModel, BeforeValidator, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..lib.types import CharacterType
 from .base import BaseArtifact
@@ -42,19 +40,10 @@ class InventoryItem(BaseModel):
     equipped: bool = Field(default=False)
 
 
-def _validate_character_type(v: CharacterType | str) -> CharacterType:
-    """Convert string to CharacterType enum."""
-    if isinstance(v, str):
-        return CharacterType(v)
-    return v
-
-
 class CharacterSheet(BaseArtifact):
     """Character sheet artifact (PC or NPC)."""
 
-    character_type: Annotated[
-        CharacterType, BeforeValidator(_validate_character_type)
-    ] = Field(..., alias="type")
+    character_type: CharacterType = Field(..., alias="type", strict=False)
     identity: CharacterIdentity
     abilities: dict[str, int] = Field(default_factory=dict)  # e.g., {"strength": 16}
     combat: CombatStats = Field(default_factory=CombatStats)
@@ -62,5 +51,5 @@ class CharacterSheet(BaseArtifact):
     conditions: list[str] = Field(default_factory=list)
     notes: str | None = None
 
-    model_config = BaseArtifact.model_config.copy()
-    model_config["populate_by_name"] = True
+    # Merged with BaseArtifact's config by pydantic
+    model_config = ConfigDict(populate_by_name=True)
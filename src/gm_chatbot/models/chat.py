@@ -1,8 +1,9 @@
 """Chat and API response models."""
 
+import secrets
 from datetime import datetime
+from functools import partial
 from typing import Generic, TypeVar
-from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
@@ -31,7 +32,7 @@ class ErrorDetail(BaseModel):
 class ResponseMeta(BaseModel):
     """Metadata for API responses."""
 
-    request_id: str = Field(default_factory=lambda: str(uuid4()))
+    request_id: str = Field(default_factory=partial(secrets.token_hex, 16))
     timestamp: datetime = Field(default_factory=utc_now)
     processing_time_ms: float = 0.0
 
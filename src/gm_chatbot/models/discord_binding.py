@@ -1,13 +1,22 @@
 """Discord binding model for binding campaigns to Discord channels."""
 
-from datetime import UTC, datetime
-from typing import Any
+from datetime import datetime
+from typing import Literal
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 
+from ..lib.datetime import utc_now
 from .base import BaseArtifact
 
 
+class BindingSettings(BaseModel):
+    """Per-binding behavior settings."""
+
+    auto_create_session_threads: bool = True
+    dice_roll_visibility: Literal["public", "private"] = "public"
+    allow_spectators: bool = True
+
+
 class DiscordBinding(BaseArtifact):
     """Discord binding artifact binding a campaign to a Discord channel."""
 
@@ -15,19 +24,6 @@ class DiscordBinding(BaseArtifact):
     guild_id: str = Field(..., min_length=1)  # Discord snowflake
     channel_id: str = Field(..., min_length=1)  # Discord snowflake
     channel_name: str = Field(..., min_length=1)
-    bound_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    bound_at: datetime = Field(default_factory=utc_now)
     bound_by: str = Field(..., min_length=1)  # player_id
-    settings: dict = Field(
-        default_factory=lambda: {
-            "auto_create_session_threads": True,
-            "dice_roll_visibility": "public",
-            "allow_spectators": True,
-        }
-    )
-
-    def model_post_init(self, __context: Any) -> None:
-        """Update metadata after initialization."""
-        if not self.metadata.created_at:
-            self.metadata.created_at = datetime.now(UTC)
-        if not self.metadata.updated_at:
-            self.metadata.updated_at = datetime.now(UTC)
+    settings: BindingSettings = Field(default_factory=BindingSettings)
@@ -1,10 +1,10 @@
 """Discord link model for linking Discord users to players."""
 
-from datetime import UTC, datetime
-from typing import Any
+from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from ..lib.datetime import utc_now
 from .base import BaseArtifact
 
 
@@ -13,7 +13,7 @@ class GuildInfo(BaseModel):
 
     guild_id: str = Field(..., min_length=1)
     guild_name: str = Field(..., min_length=1)
-    joined_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    joined_at: datetime = Field(default_factory=utc_now)
 
 
 class DiscordLink(BaseArtifact):
@@ -22,12 +22,5 @@ class DiscordLink(BaseArtifact):
     player_id: str = Field(..., min_length=1)
     discord_user_id: str = Field(..., min_length=1)  # Discord snowflake
     discord_username: str = Field(..., min_length=1)
-    linked_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    linked_at: datetime = Field(default_factory=utc_now)
     guilds: list[GuildInfo] = Field(default_factory=list)  # List of guild info
-
-    def model_post_init(self, __context: Any) -> None:
-        """Update metadata after initialization."""
-        if not self.metadata.created_at:
-            self.metadata.created_at = datetime.now(UTC)
-        if not self.metadata.updated_at:
-            self.metadata.updated_at = datetime.now(UTC)
@@ -1,10 +1,10 @@
 """Session thread model for tracking Discord thread mappings."""
 
-from datetime import UTC, datetime
-from typing import Any
+from datetime import datetime
 
 from pydantic import Field
 
+from ..lib.datetime import utc_now
 from .base import BaseArtifact
 
 
@@ -13,12 +13,5 @@ class SessionThread(BaseArtifact):
 
     session_id: str = Field(..., min_length=1)
     thread_id: str = Field(..., min_length=1)  # Discord snowflake
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utc_now)
     archived_at: datetime | None = None
-
-    def model_post_init(self, __context: Any) -> None:
-        """Update metadata after initialization."""
-        if not self.metadata.created_at:
-            self.metadata.created_at = datetime.now(UTC)
-        if not self.metadata.updated_at:
-            self.metadata.updated_at = datetime.now(UTC)
@@ -21,6 +21,13 @@ class RulesEngine:
             rules_dir = os.getenv("RULES_DIR", "/data/rules")
         self.loader = RuleLoader(rules_dir)
         self._current_ruleset: RuleSet | None = None
+        # Lowercased ability names and abbreviations -> definition
+        self._ability_index: dict[str, AbilityDefinition] = {}
+        # Ability score -> modifier for every score covered by range_mapping
+        self._modifier_table: dict[int, int] = {}
+        # Difficulty classes and dice expressions keyed by lowercased name
+        self._dc_index: dict[str, int] = {}
+        self._dice_expr_index: dict[str, str] = {}
 
     def load_system(self, system: str, version: str | None = None) -> RuleSet:
         """
@@ -34,6 +41,23 @@ class RulesEngine:
             Loaded RuleSet
         """
         self._current_ruleset = self.loader.load_rules(system, version)
+        self._ability_index = {}
+        for ability in self._current_ruleset.abilities:
+            # setdefault keeps the first match, as a scan in list order would
+            self._ability_index.setdefault(ability.name.lower(), ability)
+            self._ability_index.setdefault(ability.abbreviation.lower(), ability)
+        self._modifier_table = {}
+        for mapping in self._current_ruleset.ability_modifiers.range_mapping:
+            low, high = mapping.range
+            for score in range(low, high + 1):
+                self._modifier_table.setdefault(score, mapping.modifier)
+        self._dc_index = {
+            name.lower(): dc for name, dc in self._current_ruleset.difficulty_classes.items()
+        }
+        self._dice_expr_index = {
+            name.lower(): expression
+            for name, expression in self._current_ruleset.dice_expressions.items()
+        }
         return self._current_ruleset
 
     def get_ability_definition(self, ability_name: str) -> AbilityDefinition | None:
@@ -46,17 +70,7 @@ class RulesEngine:
         Returns:
             AbilityDefinition or None if not found
         """
-        if not self._current_ruleset:
-            return None
-
-        ability_lower = ability_name.lower()
-        for ability in self._current_ruleset.abilities:
-            if (
-                ability.name.lower() == ability_lower
-                or ability.abbreviation.lower() == ability_lower
-            ):
-                return ability
-        return None
+        return self._ability_index.get(ability_name.lower())
 
     def get_ability_modifier(self, ability_score: int) -> int:
         """
@@ -68,14 +82,7 @@ class RulesEngine:
         Returns:
             Modifier value
         """
-        if not self._current_ruleset:
-            return 0
-
-        for mapping in self._current_ruleset.ability_modifiers.range_mapping:
-            score_range = mapping.range
-            if score_range[0] <= ability_score <= score_range[1]:
-                return mapping.modifier
-        return 0
+        return self._modifier_table.get(ability_score, 0)
 
     def get_difficulty_class(self, difficulty: str) -> int | None:
         """
@@ -87,20 +94,17 @@ class RulesEngine:
         Returns:
             DC value or None if not found
         """
-        if not self._current_ruleset:
-            return None
-        return self._current_ruleset.difficulty_classes.get(difficulty.lower())
+        return self._dc_index.get(difficulty.lower())
 
     def get_dice_expression(self, expression_name: str) -> str | None:
         """
         Get dice expression template.
 
         Args:
-            expression_name: Name of expression (e.g., "ability_check")
+            expression_name: Name of expression (e.g., "ability_check"),
+                matched case-insensitively
 
         Returns:
             Expression template or None if not found
         """
-        if not self._current_ruleset:
-            return None
-        return self._current_ruleset.dice_expressions.get(expression_name)
+        return self._dice_expr_index.get(expression_name.lower())
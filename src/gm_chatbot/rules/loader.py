@@ -1,17 +1,22 @@
 """Rule loader for YAML rule files."""
 
 import os
+from collections import OrderedDict
 from pathlib import Path
 
 import yaml
 from pydantic import ValidationError
 
+from ..lib.yaml import SafeLoader
 from ..models.rules import RuleSet
 
 
 class RuleLoader:
     """Loads and validates game rules from YAML files."""
 
+    # Loaded rule sets kept in memory, least recently used evicted first
+    CACHE_MAXSIZE = 32
+
     def __init__(self, rules_dir: Path | str | None = None):
         """
         Initialize rule loader.
@@ -22,12 +27,16 @@ class RuleLoader:
         if rules_dir is None:
             rules_dir = os.getenv("RULES_DIR", "/data/rules")
         self.rules_dir = Path(rules_dir)
-        self._cache: dict[str, RuleSet] = {}
+        # cache key -> (stat key of the rule file, rule set)
+        self._cache: OrderedDict[str, tuple[tuple[int, int, int], RuleSet]] = OrderedDict()
 
     def load_rules(self, system: str, version: str | None = None) -> RuleSet:
         """
         Load rules for a game system.
 
+        Cached rule sets are reused while the rule file's inode, mtime and
+        size are unchanged, so edits are picked up on the next call.
+
         Args:
             system: Game system name (e.g., "shadowdark")
             version: Optional version string (defaults to latest)
@@ -40,21 +49,29 @@ class RuleLoader:
             ValidationError: If rules are invalid
         """
         cache_key = f"{system}:{version or 'latest'}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
         rule_file = self.rules_dir / system / "core.yaml"
-        if not rule_file.exists():
-            raise FileNotFoundError(f"Rule file not found: {rule_file}")
+        try:
+            stat = rule_file.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Rule file not found: {rule_file}") from None
+
+        stat_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == stat_key:
+            self._cache.move_to_end(cache_key)
+            return cached[1]
 
         try:
             with rule_file.open() as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
                 if data is None:
                     raise ValueError(f"Rule file is empty: {rule_file}")
 
             ruleset = RuleSet.model_validate(data)
-            self._cache[cache_key] = ruleset
+            self._cache[cache_key] = (stat_key, ruleset)
+            self._cache.move_to_end(cache_key)
+            if len(self._cache) > self.CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
             return ruleset
         except ValidationError as e:
             raise ValidationError(f"Invalid rules in {rule_file}: {e.errors()}") from e
@@ -1,5 +1,7 @@
 """Campaign service for CRUD operations."""
 
+import asyncio
+from collections import OrderedDict
 from uuid import uuid4
 
 from ..artifacts.store import ArtifactStore
@@ -9,6 +11,9 @@ from ..lib.types import CampaignStatus, MembershipRole
 from ..models.campaign import Campaign
 from ..models.membership import CampaignMembership
 
+# Character last seen per (campaign_id, player_id); membership writes update it
+MEMBER_CHARACTER_CACHE_MAXSIZE = 1024
+
 
 class CampaignService:
     """Service for managing campaigns."""
@@ -22,6 +27,7 @@ class CampaignService:
         """
         self.store = store or ArtifactStore()
         self.validator = ArtifactValidator()
+        self._member_characters: OrderedDict[tuple[str, str], str] = OrderedDict()
 
     async def create_campaign(
         self,
@@ -82,7 +88,33 @@ class CampaignService:
         Raises:
             FileNotFoundError: If campaign not found
         """
-        return self.store.load_artifact(Campaign, campaign_id, "campaign.yaml")  # type: ignore[return-value]
+        return await self.store.load_artifact_async(Campaign, campaign_id, "campaign.yaml")  # type: ignore[return-value]
+
+    async def get_campaigns(self, campaign_ids: list[str]) -> dict[str, Campaign]:
+        """
+        Get several campaigns in a single pass.
+
+        Args:
+            campaign_ids: Campaign identifiers
+
+        Returns:
+            Mapping of campaign ID to campaign; campaigns that are missing
+            or fail to load are omitted
+        """
+        unique_ids = list(dict.fromkeys(campaign_ids))
+        results = await asyncio.gather(
+            *(
+                self.store.load_artifact_async(Campaign, campaign_id, "campaign.yaml")
+                for campaign_id in unique_ids
+            ),
+            return_exceptions=True,
+        )
+
+        return {
+            campaign_id: result  # type: ignore[misc]
+            for campaign_id, result in zip(unique_ids, results, strict=True)
+            if not isinstance(result, BaseException)
+        }
 
     async def update_campaign(self, campaign: Campaign) -> Campaign:
         """
@@ -109,24 +141,34 @@ class CampaignService:
         """
         List all campaigns.
 
+        The directory scan and every campaign load run on the store's I/O
+        pool, so the loads overlap and the event loop is never blocked.
+
         Returns:
             List of campaigns
         """
-        campaigns = []
-        if not self.store.campaigns_dir.exists():
-            return campaigns
-
-        for campaign_dir in self.store.campaigns_dir.iterdir():
-            if campaign_dir.is_dir():
-                try:
-                    campaign = await self.get_campaign(campaign_dir.name)
-                    campaigns.append(campaign)
-                except FileNotFoundError:
-                    # Skip if campaign.yaml doesn't exist
-                    continue
+        campaign_ids = await self.store.run_io(self._list_campaign_ids)
+        results = await asyncio.gather(
+            *(self.get_campaign(campaign_id) for campaign_id in campaign_ids),
+            return_exceptions=True,
+        )
 
+        campaigns = []
+        for result in results:
+            if isinstance(result, FileNotFoundError):
+                # Skip if campaign.yaml doesn't exist
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            campaigns.append(result)
         return campaigns
 
+    def _list_campaign_ids(self) -> list[str]:
+        """List the names of all campaign directories (blocking)."""
+        if not self.store.campaigns_dir.exists():
+            return []
+        return [path.name for path in self.store.campaigns_dir.iterdir() if path.is_dir()]
+
     async def delete_campaign(self, campaign_id: str) -> None:
         """
         Delete a campaign and all its artifacts.
@@ -139,6 +181,8 @@ class CampaignService:
             import shutil
 
             shutil.rmtree(campaign_dir)
+        for key in [key for key in self._member_characters if key[0] == campaign_id]:
+            del self._member_characters[key]
 
     async def add_player(
         self,
@@ -146,7 +190,8 @@ class CampaignService:
         player_id: str,
         role: str | MembershipRole = "player",
         character_id: str | None = None,
-    ) -> CampaignMembership:
+        if_not_exists: bool = False,
+    ) -> CampaignMembership | None:
         """
         Add a player to a campaign.
 
@@ -155,16 +200,20 @@ class CampaignService:
             player_id: Player identifier
             role: Membership role (player, gm, spectator)
             character_id: Optional default character ID
+            if_not_exists: Return None instead of raising if already a member
 
         Returns:
-            Created membership
+            Created membership, or None if the player was already a member
+            and if_not_exists is set
 
         Raises:
-            ValueError: If player is already a member
+            ValueError: If player is already a member (unless if_not_exists)
         """
         # Check if already a member
         existing = await self.get_membership(campaign_id, player_id)
         if existing is not None:
+            if if_not_exists:
+                return None
             raise ValueError(f"Player {player_id} is already a member of campaign {campaign_id}")
 
         # Convert string to enum if needed (for backward compatibility)
@@ -186,6 +235,7 @@ class CampaignService:
         self.store.save_artifact(
             membership, campaign_id, "membership", f"memberships/{player_id}.yaml"
         )
+        self._remember_member_character(membership)
 
         return membership
 
@@ -217,6 +267,7 @@ class CampaignService:
         membership_file = memberships_dir / f"{player_id}.yaml"
         if membership_file.exists():
             membership_file.unlink()
+            self._member_characters.pop((campaign_id, player_id), None)
         else:
             raise FileNotFoundError(
                 f"Membership not found for player {player_id} in campaign {campaign_id}"
@@ -264,6 +315,48 @@ class CampaignService:
         self.store.save_artifact(
             membership, campaign_id, "membership", f"memberships/{player_id}.yaml"
         )
+        self._remember_member_character(membership)
+
+        return membership
+
+    async def upsert_membership(
+        self,
+        campaign_id: str,
+        player_id: str,
+        role: str | MembershipRole = "player",
+        character_id: str | None = None,
+    ) -> CampaignMembership:
+        """
+        Create a membership or update the existing one with a single write.
+
+        Args:
+            campaign_id: Campaign identifier
+            player_id: Player identifier
+            role: Role for a newly created membership (existing roles are kept)
+            character_id: Optional character ID to set
+
+        Returns:
+            Created or updated membership
+        """
+        membership = await self.get_membership(campaign_id, player_id)
+        if membership is None:
+            membership = CampaignMembership(
+                player_id=player_id,
+                campaign_id=campaign_id,
+                role=MembershipRole(role) if isinstance(role, str) else role,
+                character_id=character_id,
+            )
+            membership.metadata.id = str(uuid4())
+            self.store.get_memberships_dir(campaign_id).mkdir(parents=True, exist_ok=True)
+        else:
+            if character_id is not None:
+                membership.character_id = character_id
+            membership.metadata.updated_at = utc_now()
+
+        self.store.save_artifact(
+            membership, campaign_id, "membership", f"memberships/{player_id}.yaml"
+        )
+        self._remember_member_character(membership)
 
         return membership
 
@@ -321,6 +414,29 @@ class CampaignService:
 
         return memberships
 
+    async def is_gm(self, campaign_id: str, player_id: str) -> bool:
+        """
+        Check whether a player is a GM of a campaign.
+
+        Reads only the membership's role field instead of loading the full
+        membership artifact.
+
+        Args:
+            campaign_id: Campaign identifier
+            player_id: Player identifier
+
+        Returns:
+            True if the player has a GM membership, False otherwise
+        """
+        try:
+            data = await self.store.run_io(
+                self.store.load_raw, campaign_id, f"memberships/{player_id}.yaml"
+            )
+        except FileNotFoundError:
+            return False
+        # An empty or malformed membership file grants nothing
+        return isinstance(data, dict) and data.get("role") == MembershipRole.GM.value
+
     async def get_membership(self, campaign_id: str, player_id: str) -> CampaignMembership | None:
         """
         Get a specific membership record.
@@ -336,9 +452,44 @@ class CampaignService:
         membership_file = memberships_dir / f"{player_id}.yaml"
         if membership_file.exists():
             try:
-                return self.store.load_artifact(
+                membership = await self.store.load_artifact_async(
                     CampaignMembership, campaign_id, f"memberships/{player_id}.yaml"
-                )  # type: ignore[return-value]
+                )
             except Exception:
                 return None
+            self._remember_member_character(membership)  # type: ignore[arg-type]
+            return membership  # type: ignore[return-value]
         return None
+
+    def cached_character_id(self, campaign_id: str, player_id: str) -> str | None:
+        """
+        Get the character last seen for a campaign member by this service.
+
+        Only memberships written or read through this service are tracked,
+        so the value can be stale; use it for speculative prefetches and
+        confirm it against the membership.
+
+        Args:
+            campaign_id: Campaign identifier
+            player_id: Player identifier
+
+        Returns:
+            Character ID, or None if unknown
+        """
+        return self._member_characters.get((campaign_id, player_id))
+
+    def _remember_member_character(self, membership: CampaignMembership) -> None:
+        """
+        Record a membership's character for cached_character_id.
+
+        Args:
+            membership: Membership just written or read
+        """
+        key = (membership.campaign_id, membership.player_id)
+        if membership.character_id is None:
+            self._member_characters.pop(key, None)
+            return
+        self._member_characters[key] = membership.character_id
+        self._member_characters.move_to_end(key)
+        if len(self._member_characters) > MEMBER_CHARACTER_CACHE_MAXSIZE:
+            self._member_characters.popitem(last=False)
@@ -111,7 +111,23 @@ class CharacterService:
         Raises:
             FileNotFoundError: If character not found
         """
-        # Find character file by ID
+        # Scan the characters directory on the store's I/O pool
+        return await self.store.run_io(self._find_character, campaign_id, character_id)
+
+    def _find_character(self, campaign_id: str, character_id: str) -> CharacterSheet:
+        """
+        Find a character file by ID.
+
+        Args:
+            campaign_id: Campaign identifier
+            character_id: Character identifier
+
+        Returns:
+            Character sheet instance
+
+        Raises:
+            FileNotFoundError: If character not found
+        """
         characters_dir = self.store.get_campaign_dir(campaign_id) / "characters"
         if not characters_dir.exists():
             raise FileNotFoundError(
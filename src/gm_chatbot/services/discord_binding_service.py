@@ -1,10 +1,36 @@
 """Discord binding service for managing campaign to channel bindings."""
 
+import asyncio
 import fcntl
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import UTC, datetime
 
 from ..artifacts.store import ArtifactStore
-from ..models.discord_binding import DiscordBinding
+from ..models.discord_binding import BindingSettings, DiscordBinding
+
+# Concurrent bind requests arriving within this window are applied together
+BIND_BATCH_WINDOW = 0.005
+MAX_BIND_BATCH = 32
+
+# Channel -> campaign lookups are cached and revalidated against the binding
+# file on every hit; bind/unbind also invalidate entries
+CHANNEL_CACHE_TTL = 300.0
+CHANNEL_CACHE_MAXSIZE = 4096
+
+
+@dataclass(slots=True)
+class _BindRequest:
+    """A pending bind_campaign_to_channel call."""
+
+    campaign_id: str
+    guild_id: str
+    channel_id: str
+    channel_name: str
+    bound_by: str
+    settings: BindingSettings | None
+    future: asyncio.Future
 
 
 class DiscordBindingService:
@@ -18,6 +44,9 @@ class DiscordBindingService:
             store: Optional artifact store (creates default if not provided)
         """
         self.store = store or ArtifactStore()
+        self._pending_binds: list[_BindRequest] = []
+        self._bind_lock = asyncio.Lock()
+        self._channel_cache: OrderedDict[str, tuple[float, str, tuple[int, int]]] = OrderedDict()
 
     async def bind_campaign_to_channel(
         self,
@@ -31,62 +60,57 @@ class DiscordBindingService:
         """
         Bind a campaign to a Discord channel.
 
+        Concurrent calls are batched: the first call in a batch window waits
+        briefly, then applies every pending bind against a single scan of the
+        existing bindings and writes each affected binding file once.
+
         Args:
             campaign_id: Campaign identifier
             guild_id: Discord guild ID (snowflake)
             channel_id: Discord channel ID (snowflake)
             channel_name: Discord channel name
             bound_by: Player ID who created the binding
-            settings: Optional settings dict
+            settings: Optional settings to change; keys left out keep their
+                current values
 
         Returns:
             Created or updated DiscordBinding
 
         Raises:
-            ValueError: If channel is already bound to another campaign
-        """
-        # Check if channel is already bound to another campaign
-        existing_binding = await self.get_binding_by_channel(channel_id)
-        if existing_binding and existing_binding.campaign_id != campaign_id:
-            raise ValueError(
-                f"Channel {channel_id} is already bound to campaign {existing_binding.campaign_id}"
-            )
-
-        # Check if campaign already has a binding
-        existing = await self.get_binding(campaign_id)
-        if existing:
-            # Update existing binding
-            existing.guild_id = guild_id
-            existing.channel_id = channel_id
-            existing.channel_name = channel_name
-            existing.bound_by = bound_by
-            existing.metadata.updated_at = datetime.now(UTC)
-            if settings is not None:
-                existing.settings.update(settings)
-
-            await self._save_binding(existing)
-            return existing
-
-        # Create new binding
-        binding = DiscordBinding(
+            ValueError: If settings are invalid or channel is already bound to
+                another campaign
+        """
+        # Validate before queueing so bad settings only fail this caller
+        settings_update = BindingSettings.model_validate(settings) if settings is not None else None
+        request = _BindRequest(
             campaign_id=campaign_id,
             guild_id=guild_id,
             channel_id=channel_id,
             channel_name=channel_name,
-            bound_at=datetime.now(UTC),
             bound_by=bound_by,
+            settings=settings_update,
+            future=asyncio.get_running_loop().create_future(),
         )
-        if settings is not None:
-            binding.settings.update(settings)
-
-        binding.metadata.id = str(campaign_id)  # Use campaign_id as binding ID
-
-        await self._save_binding(binding)
-        return binding
+        self._pending_binds.append(request)
+
+        if len(self._pending_binds) >= MAX_BIND_BATCH:
+            await asyncio.shield(self._flush_bind_batch())
+        elif len(self._pending_binds) == 1:
+            # First request in the window flushes the batch; shielded so a
+            # cancelled first caller still resolves everyone else's future
+            try:
+                await asyncio.sleep(BIND_BATCH_WINDOW)
+            except asyncio.CancelledError:
+                request.future.cancel()
+                raise
+            finally:
+                await asyncio.shield(self._flush_bind_batch())
+
+        return await request.future
 
     async def get_campaign_by_channel(self, channel_id: str) -> str | None:
         """
-        Get campaign ID bound to a Discord channel.
+        Get campaign ID bound to a Discord channel, reusing recent lookups.
 
         Args:
             channel_id: Discord channel ID (snowflake)
@@ -94,8 +118,28 @@ class DiscordBindingService:
         Returns:
             Campaign ID or None if not bound
         """
+        now = time.monotonic()
+        cached = self._channel_cache.get(channel_id)
+        if cached is not None and now - cached[0] < CHANNEL_CACHE_TTL:
+            _, campaign_id, stat_key = cached
+            # Any rebind or unbind, from any process, replaces or removes the file
+            if self._binding_stat_key(campaign_id) == stat_key:
+                self._channel_cache.move_to_end(channel_id)
+                return campaign_id
+            del self._channel_cache[channel_id]
+
         binding = await self.get_binding_by_channel(channel_id)
-        return binding.campaign_id if binding else None
+        if binding is None:
+            # Misses aren't cached so a bind made elsewhere is seen immediately
+            return None
+
+        stat_key = self._binding_stat_key(binding.campaign_id)
+        if stat_key is not None:
+            self._channel_cache[channel_id] = (now, binding.campaign_id, stat_key)
+            self._channel_cache.move_to_end(channel_id)
+            if len(self._channel_cache) > CHANNEL_CACHE_MAXSIZE:
+                self._channel_cache.popitem(last=False)
+        return binding.campaign_id
 
     async def get_binding(self, campaign_id: str) -> DiscordBinding | None:
         """
@@ -172,6 +216,25 @@ class DiscordBindingService:
             raise FileNotFoundError(f"Discord binding not found for campaign {campaign_id}")
 
         binding_path.unlink()
+        self._invalidate_campaign_channels(campaign_id)
+
+    async def unbind_campaign_if_exists(self, campaign_id: str) -> bool:
+        """
+        Remove Discord binding for a campaign if one exists.
+
+        Args:
+            campaign_id: Campaign identifier
+
+        Returns:
+            True if a binding was removed, False if the campaign was not bound
+        """
+        binding_path = self.store.get_discord_binding_path(campaign_id)
+        if not binding_path.exists():
+            return False
+
+        binding_path.unlink()
+        self._invalidate_campaign_channels(campaign_id)
+        return True
 
     async def list_campaigns_in_guild(self, guild_id: str) -> list[DiscordBinding]:
         """
@@ -183,32 +246,162 @@ class DiscordBindingService:
         Returns:
             List of DiscordBinding instances
         """
+        # Read every binding in one hop to the store's I/O pool
+        bindings = await self.store.run_io(self._load_bindings)
+        return [binding for binding in bindings if binding.guild_id == guild_id]
+
+    async def _flush_bind_batch(self) -> None:
+        """Apply all pending bind requests and resolve their futures."""
+        batch, self._pending_binds = self._pending_binds, []
+        # Waiters cancelled while queued don't get applied
+        batch = [request for request in batch if not request.future.done()]
+        if not batch:
+            return
+
+        try:
+            # Serialize batches so each one scans bindings the previous one wrote
+            async with self._bind_lock:
+                outcomes = await self.store.run_io(self._apply_bind_batch, batch)
+        except Exception as e:
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        for request, outcome in zip(batch, outcomes, strict=True):
+            if isinstance(outcome, DiscordBinding):
+                self._invalidate_campaign_channels(request.campaign_id)
+                self._channel_cache.pop(request.channel_id, None)
+            if request.future.done():
+                continue
+            if isinstance(outcome, Exception):
+                request.future.set_exception(outcome)
+            else:
+                request.future.set_result(outcome)
+
+    def _apply_bind_batch(self, batch: list[_BindRequest]) -> list[DiscordBinding | ValueError]:
+        """
+        Apply bind requests against a single scan of the existing bindings.
+
+        Runs on the store's I/O pool, so it must not touch the futures.
+
+        Args:
+            batch: Pending bind requests, in arrival order
+
+        Returns:
+            The binding or conflict error for each request, in batch order
+        """
+        bindings = {binding.campaign_id: binding for binding in self._load_bindings()}
+        channel_owners = {
+            binding.channel_id: campaign_id for campaign_id, binding in bindings.items()
+        }
+        changed: dict[str, DiscordBinding] = {}
+        outcomes: list[DiscordBinding | ValueError] = []
+
+        for request in batch:
+            owner = channel_owners.get(request.channel_id)
+            if owner is not None and owner != request.campaign_id:
+                outcomes.append(
+                    ValueError(f"Channel {request.channel_id} is already bound to campaign {owner}")
+                )
+                continue
+
+            binding = bindings.get(request.campaign_id)
+            if binding:
+                # Update existing binding
+                channel_owners.pop(binding.channel_id, None)
+                binding.guild_id = request.guild_id
+                binding.channel_id = request.channel_id
+                binding.channel_name = request.channel_name
+                binding.bound_by = request.bound_by
+                binding.metadata.updated_at = datetime.now(UTC)
+            else:
+                # Create new binding
+                binding = DiscordBinding(
+                    campaign_id=request.campaign_id,
+                    guild_id=request.guild_id,
+                    channel_id=request.channel_id,
+                    channel_name=request.channel_name,
+                    bound_at=datetime.now(UTC),
+                    bound_by=request.bound_by,
+                )
+                # Use campaign_id as binding ID
+                binding.metadata.id = str(request.campaign_id)
+                bindings[request.campaign_id] = binding
+            if request.settings is not None:
+                binding.settings = binding.settings.model_copy(
+                    update=request.settings.model_dump(exclude_unset=True)
+                )
+
+            channel_owners[request.channel_id] = request.campaign_id
+            changed[request.campaign_id] = binding
+            outcomes.append(binding)
+
+        for binding in changed.values():
+            self._write_binding(binding)
+
+        # A later request in the batch may have moved an earlier one's binding
+        return [
+            changed[request.campaign_id] if isinstance(outcome, DiscordBinding) else outcome
+            for request, outcome in zip(batch, outcomes, strict=True)
+        ]
+
+    def _invalidate_campaign_channels(self, campaign_id: str) -> None:
+        """
+        Drop cached channel lookups that resolve to a campaign.
+
+        Args:
+            campaign_id: Campaign identifier
+        """
+        stale = [
+            channel_id
+            for channel_id, (_, cached_id, _) in self._channel_cache.items()
+            if cached_id == campaign_id
+        ]
+        for channel_id in stale:
+            del self._channel_cache[channel_id]
+
+    def _binding_stat_key(self, campaign_id: str) -> tuple[int, int] | None:
+        """
+        Get a cheap change key for a campaign's binding file.
+
+        Args:
+            campaign_id: Campaign identifier
+
+        Returns:
+            (inode, mtime_ns) of the binding file, or None if it doesn't exist
+        """
+        try:
+            stat = self.store.get_discord_binding_path(campaign_id).stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns)
+
+    def _load_bindings(self) -> list[DiscordBinding]:
+        """Load every readable binding in the campaigns directory."""
         bindings = []
         campaigns_dir = self.store.campaigns_dir
         if not campaigns_dir.exists():
             return bindings
 
         for campaign_dir in campaigns_dir.iterdir():
-            if campaign_dir.is_dir():
-                binding_path = campaign_dir / "discord_binding.yaml"
-                if binding_path.exists():
-                    try:
-                        with binding_path.open() as f:
-                            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                            try:
-                                content = f.read()
-                            finally:
-                                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            binding_path = campaign_dir / "discord_binding.yaml"
+            if binding_path.exists():
+                try:
+                    with binding_path.open() as f:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+                        try:
+                            content = f.read()
+                        finally:
+                            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
-                        binding = DiscordBinding.from_yaml(content)
-                        if binding.guild_id == guild_id:
-                            bindings.append(binding)
-                    except Exception:
-                        continue
+                    bindings.append(DiscordBinding.from_yaml(content))
+                except Exception:
+                    continue
 
         return bindings
 
-    async def _save_binding(self, binding: DiscordBinding) -> None:
+    def _write_binding(self, binding: DiscordBinding) -> None:
         """
         Save Discord binding to file.
 
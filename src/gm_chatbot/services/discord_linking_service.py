@@ -1,6 +1,8 @@
 """Discord linking service for managing Discord user to player links."""
 
 import fcntl
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 from uuid import uuid4
 
@@ -9,6 +11,10 @@ from ..models.discord_link import DiscordLink, GuildInfo
 from ..models.player import Player
 from ..services.player_service import PlayerService
 
+# Discord user -> player ID lookups are cached; link/unlink update entries
+PLAYER_ID_CACHE_TTL = 300.0
+PLAYER_ID_CACHE_MAXSIZE = 10_000
+
 
 class DiscordLinkingService:
     """Service for managing Discord user to player links."""
@@ -22,6 +28,7 @@ class DiscordLinkingService:
         """
         self.store = store or ArtifactStore()
         self.player_service = PlayerService(self.store)
+        self._player_id_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
 
     async def link_discord_user(
         self,
@@ -46,6 +53,86 @@ class DiscordLinkingService:
         Returns:
             Created or updated DiscordLink
         """
+        link, _ = await self._link_discord_user(
+            discord_user_id, discord_username, player_id, guild_id, guild_name
+        )
+        return link
+
+    async def auto_link_player(
+        self,
+        discord_user_id: str,
+        discord_username: str,
+        guild_id: str | None = None,
+        guild_name: str | None = None,
+    ) -> Player:
+        """
+        Link a Discord user, auto-creating a player if needed, and return the player.
+
+        Args:
+            discord_user_id: Discord user ID (snowflake)
+            discord_username: Discord username
+            guild_id: Optional guild ID to add to guilds list
+            guild_name: Optional guild name (required if guild_id provided)
+
+        Returns:
+            Linked player
+
+        Raises:
+            FileNotFoundError: If an existing link points at a missing player
+        """
+        link, player = await self._link_discord_user(
+            discord_user_id, discord_username, None, guild_id, guild_name
+        )
+        if player is None:
+            player = await self.player_service.get_player(link.player_id)
+        return player
+
+    async def ensure_player(
+        self,
+        discord_user_id: str,
+        discord_username: str,
+        guild_id: str | None = None,
+        guild_name: str | None = None,
+    ) -> Player:
+        """
+        Get the player linked to a Discord user, linking a new player if needed.
+
+        Already linked users are resolved without rewriting their link.
+
+        Args:
+            discord_user_id: Discord user ID (snowflake)
+            discord_username: Discord username
+            guild_id: Optional guild ID to record for new links
+            guild_name: Optional guild name (required if guild_id provided)
+
+        Returns:
+            Linked player
+        """
+        player = await self.get_player_by_discord_id(discord_user_id)
+        if player is None:
+            player = await self.auto_link_player(
+                discord_user_id=discord_user_id,
+                discord_username=discord_username,
+                guild_id=guild_id,
+                guild_name=guild_name,
+            )
+        return player
+
+    async def _link_discord_user(
+        self,
+        discord_user_id: str,
+        discord_username: str,
+        player_id: str | None,
+        guild_id: str | None,
+        guild_name: str | None,
+    ) -> tuple[DiscordLink, Player | None]:
+        """
+        Create or update a Discord link.
+
+        Returns:
+            Tuple of the saved link and the player, if it was loaded or
+            created along the way (None when an existing link was updated)
+        """
         # Check if link already exists
         existing_link = await self.get_discord_link_by_user_id(discord_user_id)
         if existing_link:
@@ -70,7 +157,8 @@ class DiscordLinkingService:
                     )
 
             await self._save_discord_link(existing_link)
-            return existing_link
+            self._cache_player_id(discord_user_id, existing_link.player_id)
+            return existing_link, None
 
         # Create new link
         if not player_id:
@@ -81,9 +169,9 @@ class DiscordLinkingService:
                 status="offline",
             )
             player_id = player.metadata.id
-
-        # Verify player exists
-        await self.player_service.get_player(player_id)
+        else:
+            # Verify player exists
+            player = await self.player_service.get_player(player_id)
 
         # Create Discord link
         link = DiscordLink(
@@ -105,7 +193,8 @@ class DiscordLinkingService:
             )
 
         await self._save_discord_link(link)
-        return link
+        self._cache_player_id(discord_user_id, player_id)
+        return link, player
 
     async def get_player_by_discord_id(self, discord_user_id: str) -> Player | None:
         """
@@ -117,13 +206,18 @@ class DiscordLinkingService:
         Returns:
             Player instance or None if not linked
         """
-        link = await self.get_discord_link_by_user_id(discord_user_id)
-        if link is None:
-            return None
+        player_id = self._get_cached_player_id(discord_user_id)
+        if player_id is None:
+            link = await self.get_discord_link_by_user_id(discord_user_id)
+            if link is None:
+                return None
+            player_id = link.player_id
+            self._cache_player_id(discord_user_id, player_id)
 
         try:
-            return await self.player_service.get_player(link.player_id)
+            return await self.player_service.get_player(player_id)
         except FileNotFoundError:
+            self._player_id_cache.pop(discord_user_id, None)
             return None
 
     async def unlink_discord_user(self, discord_user_id: str) -> None:
@@ -144,6 +238,7 @@ class DiscordLinkingService:
         link_path = self.store.get_discord_link_path(link.player_id)
         if link_path.exists():
             link_path.unlink()
+        self._player_id_cache.pop(discord_user_id, None)
 
     async def get_discord_link(self, player_id: str) -> DiscordLink | None:
         """
@@ -205,6 +300,40 @@ class DiscordLinkingService:
 
         return None
 
+    def _get_cached_player_id(self, discord_user_id: str) -> str | None:
+        """
+        Get a recently resolved player ID whose link file still exists.
+
+        Args:
+            discord_user_id: Discord user ID (snowflake)
+
+        Returns:
+            Player ID or None on a cache miss
+        """
+        cached = self._player_id_cache.get(discord_user_id)
+        if cached is None or time.monotonic() - cached[0] >= PLAYER_ID_CACHE_TTL:
+            return None
+
+        player_id = cached[1]
+        if not self.store.get_discord_link_path(player_id).exists():
+            # Unlinked outside this service
+            del self._player_id_cache[discord_user_id]
+            return None
+        return player_id
+
+    def _cache_player_id(self, discord_user_id: str, player_id: str) -> None:
+        """
+        Remember which player a Discord user is linked to.
+
+        Args:
+            discord_user_id: Discord user ID (snowflake)
+            player_id: Linked player identifier
+        """
+        self._player_id_cache[discord_user_id] = (time.monotonic(), player_id)
+        self._player_id_cache.move_to_end(discord_user_id)
+        if len(self._player_id_cache) > PLAYER_ID_CACHE_MAXSIZE:
+            self._player_id_cache.popitem(last=False)
+
     async def _save_discord_link(self, link: DiscordLink) -> None:
         """
         Save Discord link to file.
@@ -201,22 +201,7 @@ class GameStateService:
         return state
 
     async def _persist_action(self, campaign_id: str, action: GameAction) -> None:
-        """Persist action to YAML file."""
-        state_dir = self.store.get_campaign_dir(campaign_id) / "state"
-        state_dir.mkdir(parents=True, exist_ok=True)
-
-        # Append to history.yaml
-        history_file = state_dir / "history.yaml"
-        import yaml
-
-        history_data = {"actions": []}
-        if history_file.exists():
-            with history_file.open() as f:
-                existing = yaml.safe_load(f)
-                if existing and "actions" in existing:
-                    history_data["actions"] = existing["actions"]
-
-        history_data["actions"].append(action.model_dump(mode="json"))
-
-        with history_file.open("w") as f:
-            yaml.safe_dump(history_data, f, default_flow_style=False, allow_unicode=True)
+        """Append action to the campaign's action history log on the store's I/O pool."""
+        await self.store.run_io(
+            self.store.append_event, campaign_id, "state/history", action.model_dump(mode="json")
+        )
@@ -21,7 +21,7 @@ pytest_plugins = [
 @pytest.fixture(scope="function", autouse=True)
 def setup_test_env():
     """Set up test environment variables for integration tests."""
-    from gm_chatbot.api.dependencies import reset_dependencies
+    from gm_chatbot.api.dependencies import close_dependencies, reset_dependencies
 
     # Reset dependencies before each test to ensure fresh initialization
     reset_dependencies()
@@ -48,8 +48,8 @@ def setup_test_env():
 
     shutil.rmtree(temp_base, ignore_errors=True)
 
-    # Reset dependencies after test
-    reset_dependencies()
+    # Close and reset dependencies after test
+    close_dependencies()
 
 
 @pytest.fixture
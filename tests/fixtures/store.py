@@ -26,6 +26,7 @@ def artifact_store():
     if "CAMPAIGNS_DIR" in os.environ:
         store = ArtifactStore()
         yield store
+        store.close()
     else:
         # Fallback for tests that don't use setup_test_env
         temp_dir = tempfile.mkdtemp()
@@ -35,4 +36,5 @@ def artifact_store():
         players_dir.mkdir(parents=True, exist_ok=True)
         store = ArtifactStore(campaigns_dir=str(campaigns_dir), players_dir=str(players_dir))
         yield store
+        store.close()
         shutil.rmtree(temp_dir, ignore_errors=True)
@@ -68,6 +68,20 @@ async def test_get_campaign(campaign_service):
     assert retrieved.metadata.id == created.metadata.id
 
 
+@pytest.mark.asyncio
+async def test_get_campaigns(campaign_service):
+    """Test retrieving several campaigns at once."""
+    first = await campaign_service.create_campaign(name="Campaign 1", rule_system="shadowdark")
+    second = await campaign_service.create_campaign(name="Campaign 2", rule_system="shadowdark")
+
+    campaigns = await campaign_service.get_campaigns(
+        [first.metadata.id, "missing", second.metadata.id]
+    )
+
+    assert set(campaigns) == {first.metadata.id, second.metadata.id}
+    assert campaigns[second.metadata.id].name == "Campaign 2"
+
+
 @pytest.mark.asyncio
 async def test_list_campaigns(campaign_service):
     """Test listing campaigns."""
@@ -78,6 +92,16 @@ async def test_list_campaigns(campaign_service):
     assert len(campaigns) == 2
 
 
+@pytest.mark.asyncio
+async def test_list_campaigns_skips_dirs_without_campaign(campaign_service, artifact_store):
+    """Test listing campaigns ignores directories with no campaign.yaml."""
+    created = await campaign_service.create_campaign(name="Campaign 1", rule_system="shadowdark")
+    artifact_store.get_campaign_dir("not-a-campaign").mkdir(parents=True)
+
+    campaigns = await campaign_service.list_campaigns()
+    assert [c.metadata.id for c in campaigns] == [created.metadata.id]
+
+
 @pytest.mark.asyncio
 async def test_update_campaign(campaign_service):
     """Test updating a campaign."""
@@ -168,3 +192,32 @@ async def test_campaign_join_duplicate(
     )
     assert retrieved is not None
     assert retrieved.metadata.id == membership1.metadata.id
+
+
+@pytest.mark.asyncio
+async def test_campaign_join_duplicate_if_not_exists(
+    campaign_service, player_service
+):
+    """Test that if_not_exists skips duplicate joins without raising."""
+    campaign = await campaign_service.create_campaign(
+        name="Test Campaign",
+        rule_system="shadowdark",
+    )
+    player = await player_service.create_player(
+        username="testplayer",
+        display_name="Test Player",
+    )
+
+    await campaign_service.add_player(
+        campaign_id=campaign.metadata.id,
+        player_id=player.metadata.id,
+        role="gm",
+    )
+    membership = await campaign_service.add_player(
+        campaign_id=campaign.metadata.id,
+        player_id=player.metadata.id,
+        role="gm",
+        if_not_exists=True,
+    )
+
+    assert membership is None
@@ -51,6 +51,12 @@ class TestEnsureUtc:
         assert result == utc_dt
         assert result.tzinfo == UTC
 
+    def test_utc_datetime_returned_without_copy(self):
+        """UTC datetime should be returned as the same object."""
+        utc_dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+        assert ensure_utc(utc_dt) is utc_dt
+
     def test_other_timezone_converts_to_utc(self):
         """Datetime in other timezone should convert to UTC."""
         est = timezone(timedelta(hours=-5))
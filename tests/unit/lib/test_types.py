@@ -10,6 +10,7 @@ from gm_chatbot.lib.types import (
     CampaignStatus,
     CharacterType,
     EntityId,
+    InternedStr,
     NonEmptyStr,
     PlayerStatus,
     PositiveInt,
@@ -82,6 +83,21 @@ class TestNonEmptyStr:
             self.Model(value="   ")
 
 
+class TestInternedStr:
+    """Tests for InternedStr type."""
+
+    def test_equal_values_share_one_object(self):
+        """Equal validated strings should be the same object."""
+
+        class TestModel(BaseModel):
+            value: InternedStr
+
+        first = TestModel(value="".join(["shadow", "dark"]))
+        second = TestModel(value="".join(["shadow", "dark"]))
+        assert first.value == "shadowdark"
+        assert first.value is second.value
+
+
 class TestEntityId:
     """Tests for EntityId type."""
 
@@ -124,6 +140,11 @@ class TestEntityId:
         with pytest.raises(ValidationError):
             self.Model(id="player 123")
 
+    def test_id_with_trailing_newline_raises_error(self):
+        """EntityId should reject a trailing newline."""
+        with pytest.raises(ValidationError):
+            self.Model(id="player_123\n")
+
 
 class TestSlugStr:
     """Tests for SlugStr type."""
@@ -0,0 +1,215 @@
+"""Unit tests for ArtifactStore."""
+
+from pathlib import Path
+
+import pytest
+
+from gm_chatbot.artifacts.store import ArtifactStore
+from gm_chatbot.models.campaign import Campaign
+
+
+class TestEventLog:
+    """Tests for append-only event logs."""
+
+    def test_append_and_load_events(self, artifact_store):
+        """Appended events load back in order."""
+        artifact_store.append_event("campaign-1", "state/history", {"n": 1})
+        artifact_store.append_event("campaign-1", "state/history", {"n": 2})
+
+        events = artifact_store.load_events("campaign-1", "state/history")
+
+        assert events == [{"n": 1}, {"n": 2}]
+        state_dir = artifact_store.get_campaign_dir("campaign-1") / "state"
+        assert (state_dir / "history.log").exists()
+
+    def test_load_events_missing_log(self, artifact_store):
+        """Loading a log that was never written returns no events."""
+        assert artifact_store.load_events("campaign-1", "state/history") == []
+
+    def test_log_compacts_into_snapshot(self, artifact_store, monkeypatch):
+        """The log is folded into the snapshot once it exceeds the threshold."""
+        monkeypatch.setattr(ArtifactStore, "EVENT_LOG_COMPACT_THRESHOLD", 3)
+
+        for n in range(6):
+            artifact_store.append_event("campaign-1", "state/history", {"n": n})
+
+        state_dir = artifact_store.get_campaign_dir("campaign-1") / "state"
+        assert (state_dir / "history.snapshot.jsonl").exists()
+        assert len((state_dir / "history.log").read_text().splitlines()) == 2
+        events = artifact_store.load_events("campaign-1", "state/history")
+        assert events == [{"n": n} for n in range(6)]
+
+    def test_interrupted_compaction_does_not_duplicate_events(self, artifact_store, monkeypatch):
+        """A crash between writing the snapshot and replacing the log loses nothing."""
+        monkeypatch.setattr(ArtifactStore, "EVENT_LOG_COMPACT_THRESHOLD", 3)
+        for n in range(3):
+            artifact_store.append_event("campaign-1", "state/history", {"n": n})
+
+        def crash(self, *args, **kwargs):
+            raise OSError("simulated crash")
+
+        # Fail right after the snapshot is written, before the empty log is made
+        with monkeypatch.context() as patch:
+            patch.setattr(Path, "touch", crash)
+            with pytest.raises(OSError):
+                artifact_store.append_event("campaign-1", "state/history", {"n": 3})
+
+        events = artifact_store.load_events("campaign-1", "state/history")
+        assert events == [{"n": n} for n in range(4)]
+
+        # A fresh store (no cached line count) keeps appending and compacting correctly
+        store = ArtifactStore(
+            campaigns_dir=artifact_store.campaigns_dir, players_dir=artifact_store.players_dir
+        )
+        for n in range(4, 9):
+            store.append_event("campaign-1", "state/history", {"n": n})
+        store.close()
+        events = artifact_store.load_events("campaign-1", "state/history")
+        assert events == [{"n": n} for n in range(9)]
+
+    def test_partial_trailing_line_is_skipped(self, artifact_store):
+        """A line cut short by a crash is ignored on load and dropped on append."""
+        artifact_store.append_event("campaign-1", "state/history", {"n": 0})
+        log_path = artifact_store.get_campaign_dir("campaign-1") / "state" / "history.log"
+        with log_path.open("a") as f:
+            f.write('{"n":')
+
+        assert artifact_store.load_events("campaign-1", "state/history") == [{"n": 0}]
+
+        artifact_store.append_event("campaign-1", "state/history", {"n": 1})
+        events = artifact_store.load_events("campaign-1", "state/history")
+        assert events == [{"n": 0}, {"n": 1}]
+
+    def test_compaction_cut_short_is_redone(self, artifact_store, monkeypatch):
+        """Snapshot lines written without their closing marker are discarded."""
+        monkeypatch.setattr(ArtifactStore, "EVENT_LOG_COMPACT_THRESHOLD", 3)
+        for n in range(4):
+            artifact_store.append_event("campaign-1", "state/history", {"n": n})
+        snapshot_path = (
+            artifact_store.get_campaign_dir("campaign-1") / "state" / "history.snapshot.jsonl"
+        )
+        compacted = snapshot_path.read_text()
+        assert compacted.count("\n") == 5
+
+        # Simulate a crash partway through the next compaction's append
+        with snapshot_path.open("a") as f:
+            f.write('{"n":4}\n{"n":')
+        assert artifact_store.load_events("campaign-1", "state/history") == [
+            {"n": n} for n in range(4)
+        ]
+
+        for n in range(4, 8):
+            artifact_store.append_event("campaign-1", "state/history", {"n": n})
+        events = artifact_store.load_events("campaign-1", "state/history")
+        assert events == [{"n": n} for n in range(8)]
+        # The second compaction appended after the first instead of rewriting it
+        assert snapshot_path.read_text().startswith(compacted)
+
+    def test_load_legacy_snapshot(self, artifact_store):
+        """Snapshots stored as a bare event list still load."""
+        state_dir = artifact_store.get_campaign_dir("campaign-1") / "state"
+        state_dir.mkdir(parents=True)
+        (state_dir / "history.snapshot.json").write_text('[{"n":0}]')
+        artifact_store.append_event("campaign-1", "state/history", {"n": 1})
+
+        events = artifact_store.load_events("campaign-1", "state/history")
+
+        assert events == [{"n": 0}, {"n": 1}]
+
+
+class TestAsyncLoad:
+    """Tests for loading artifacts on the I/O pool."""
+
+    async def test_load_artifact_async(self, artifact_store):
+        """Artifacts load off the event loop with the same result."""
+        campaign = Campaign(name="Test Campaign", rule_system="shadowdark")
+        artifact_store.save_artifact(campaign, "campaign-1", "campaign", "campaign.yaml")
+
+        loaded = await artifact_store.load_artifact_async(Campaign, "campaign-1", "campaign.yaml")
+
+        assert loaded.name == "Test Campaign"
+
+    async def test_load_artifact_async_missing(self, artifact_store):
+        """Missing artifacts raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await artifact_store.load_artifact_async(Campaign, "campaign-1", "campaign.yaml")
+
+    async def test_close_shuts_down_io_pool(self, artifact_store):
+        """A closed store stops accepting I/O and can be closed again."""
+        artifact_store.close()
+        artifact_store.close()
+
+        with pytest.raises(RuntimeError):
+            await artifact_store.run_io(artifact_store.load_events, "campaign-1", "state/history")
+
+
+class TestReadCache:
+    """Tests for the stat-validated artifact read cache."""
+
+    def test_unchanged_artifact_served_from_cache(self, artifact_store, monkeypatch):
+        """A second load of an unchanged file does not reopen it."""
+        campaign = Campaign(name="Test Campaign", rule_system="shadowdark")
+        artifact_store.save_artifact(campaign, "campaign-1", "campaign", "campaign.yaml")
+        artifact_store.load_artifact(Campaign, "campaign-1", "campaign.yaml")
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("cached artifact should not be reopened")
+
+        monkeypatch.setattr(Path, "open", fail_open)
+
+        loaded = artifact_store.load_artifact(Campaign, "campaign-1", "campaign.yaml")
+        assert loaded.name == "Test Campaign"
+
+    def test_saved_artifact_invalidates_cache(self, artifact_store):
+        """Saving an artifact makes the next load see the new contents."""
+        campaign = Campaign(name="Test Campaign", rule_system="shadowdark")
+        artifact_store.save_artifact(campaign, "campaign-1", "campaign", "campaign.yaml")
+        artifact_store.load_artifact(Campaign, "campaign-1", "campaign.yaml")
+
+        campaign.name = "Renamed Campaign"
+        artifact_store.save_artifact(campaign, "campaign-1", "campaign", "campaign.yaml")
+
+        loaded = artifact_store.load_artifact(Campaign, "campaign-1", "campaign.yaml")
+        assert loaded.name == "Renamed Campaign"
+
+    def test_source_key_tracks_file_changes(self, artifact_store):
+        """Loaded artifacts carry a key that changes whenever the file does."""
+        campaign = Campaign(name="Test Campaign", rule_system="shadowdark")
+        assert campaign.source_key is None
+        path = artifact_store.save_artifact(campaign, "campaign-1", "campaign", "campaign.yaml")
+
+        loaded = artifact_store.load_artifact(Campaign, "campaign-1", "campaign.yaml")
+        assert loaded.source_key == campaign.source_key is not None
+
+        # A hand edit that leaves the metadata untouched still changes the key
+        path.write_text(path.read_text().replace("Test Campaign", "Edited Campaign"))
+        edited = artifact_store.load_artifact(Campaign, "campaign-1", "campaign.yaml")
+        assert edited.name == "Edited Campaign"
+        assert edited.source_key != loaded.source_key
+
+
+class TestTrustedReload:
+    """Tests for skipping validation on artifacts this store wrote."""
+
+    def test_own_write_skips_validation(self, artifact_store, monkeypatch):
+        """Loading a just-saved artifact does not run model validation."""
+        campaign = Campaign(name="Test Campaign", rule_system="shadowdark")
+        artifact_store.save_artifact(campaign, "campaign-1", "campaign", "campaign.yaml")
+
+        def fail_validate(*args, **kwargs):
+            raise AssertionError("trusted artifact should not be validated")
+
+        monkeypatch.setattr(Campaign, "from_yaml", fail_validate)
+
+        loaded = artifact_store.load_artifact(Campaign, "campaign-1", "campaign.yaml")
+        assert loaded == campaign
+
+    def test_external_edit_is_validated(self, artifact_store):
+        """A file changed outside the store goes through full validation."""
+        campaign = Campaign(name="Test Campaign", rule_system="shadowdark")
+        path = artifact_store.save_artifact(campaign, "campaign-1", "campaign", "campaign.yaml")
+
+        path.write_text(path.read_text().replace("status: draft", "status: not-a-status"))
+
+        with pytest.raises(ValueError):
+            artifact_store.load_artifact(Campaign, "campaign-1", "campaign.yaml")
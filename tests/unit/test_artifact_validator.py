@@ -0,0 +1,40 @@
+"""Unit tests for ArtifactValidator."""
+
+import pytest
+from pydantic import ValidationError
+
+from gm_chatbot.artifacts.validator import ArtifactValidator
+from gm_chatbot.models.campaign import Campaign
+
+
+class TestValidateArtifact:
+    """Tests for validate_artifact."""
+
+    def test_trusted_artifact_skips_round_trip(self, monkeypatch):
+        """Constructed artifacts are trusted without re-validation."""
+        campaign = Campaign(name="Test Campaign", rule_system="shadowdark")
+
+        def fail_dump(*args, **kwargs):
+            raise AssertionError("model_dump should not be called")
+
+        monkeypatch.setattr(Campaign, "model_dump", fail_dump)
+
+        assert ArtifactValidator().validate_artifact(campaign) is True
+
+    def test_deep_validate_round_trips(self):
+        """deep_validate re-parses the dumped artifact."""
+        campaign = Campaign(name="Test Campaign", rule_system="shadowdark")
+
+        assert ArtifactValidator().validate_artifact(campaign, deep_validate=True) is True
+
+
+class TestValidateData:
+    """Tests for dict validation methods."""
+
+    def test_invalid_campaign_raises_original_error(self):
+        """Pydantic's ValidationError propagates unwrapped."""
+        with pytest.raises(ValidationError) as exc_info:
+            ArtifactValidator().validate_campaign({"name": "", "rule_system": "shadowdark"})
+
+        assert exc_info.value.title == "Campaign"
+        assert exc_info.value.errors()[0]["loc"] == ("name",)
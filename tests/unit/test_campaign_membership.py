@@ -1,6 +1,7 @@
 """Unit tests for CampaignService membership operations."""
 
 import pytest
+import yaml
 
 from gm_chatbot.services.campaign_service import CampaignService
 from gm_chatbot.services.player_service import PlayerService
@@ -115,3 +116,118 @@ async def test_update_membership(artifact_store):
     )
 
     assert updated.role == "gm"
+
+
+@pytest.mark.asyncio
+async def test_upsert_membership(artifact_store):
+    """Test upsert creates a membership, then updates it in place."""
+    campaign_service = CampaignService(store=artifact_store)
+    player_service = PlayerService(store=artifact_store)
+
+    campaign = await campaign_service.create_campaign(
+        name="Test Campaign",
+        rule_system="shadowdark",
+    )
+    player = await player_service.create_player(
+        username="testplayer",
+        display_name="Test Player",
+    )
+
+    created = await campaign_service.upsert_membership(
+        campaign_id=campaign.metadata.id,
+        player_id=player.metadata.id,
+        role="gm",
+        character_id="char-1",
+    )
+    updated = await campaign_service.upsert_membership(
+        campaign_id=campaign.metadata.id,
+        player_id=player.metadata.id,
+        role="player",
+        character_id="char-2",
+    )
+
+    assert updated.metadata.id == created.metadata.id
+    assert updated.role == "gm"
+    assert updated.character_id == "char-2"
+
+
+@pytest.mark.asyncio
+async def test_is_gm(artifact_store):
+    """Test is_gm distinguishes GMs, players, and non-members."""
+    campaign_service = CampaignService(store=artifact_store)
+
+    campaign = await campaign_service.create_campaign(
+        name="Test Campaign",
+        rule_system="shadowdark",
+    )
+    campaign_id = campaign.metadata.id
+    await campaign_service.add_player(campaign_id, "gm-player", role="gm")
+    await campaign_service.add_player(campaign_id, "regular-player", role="player")
+
+    assert await campaign_service.is_gm(campaign_id, "gm-player") is True
+    assert await campaign_service.is_gm(campaign_id, "regular-player") is False
+    assert await campaign_service.is_gm(campaign_id, "stranger") is False
+
+
+@pytest.mark.asyncio
+async def test_is_gm_surfaces_unreadable_membership(artifact_store):
+    """Test is_gm raises on a corrupt membership instead of denying silently."""
+    campaign_service = CampaignService(store=artifact_store)
+
+    campaign = await campaign_service.create_campaign(
+        name="Test Campaign",
+        rule_system="shadowdark",
+    )
+    campaign_id = campaign.metadata.id
+    membership_path = artifact_store.get_campaign_dir(campaign_id) / "memberships" / "bad.yaml"
+    membership_path.parent.mkdir(parents=True, exist_ok=True)
+    membership_path.write_text("role: [gm\n")
+
+    with pytest.raises(yaml.YAMLError):
+        await campaign_service.is_gm(campaign_id, "bad")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", ["", "- gm\n", "gm\n"])
+async def test_is_gm_non_mapping_membership(artifact_store, content):
+    """Test is_gm returns False for membership files that are not mappings."""
+    campaign_service = CampaignService(store=artifact_store)
+
+    campaign = await campaign_service.create_campaign(
+        name="Test Campaign",
+        rule_system="shadowdark",
+    )
+    campaign_id = campaign.metadata.id
+    membership_path = artifact_store.get_campaign_dir(campaign_id) / "memberships" / "odd.yaml"
+    membership_path.parent.mkdir(parents=True, exist_ok=True)
+    membership_path.write_text(content)
+
+    assert await campaign_service.is_gm(campaign_id, "odd") is False
+
+
+@pytest.mark.asyncio
+async def test_cached_character_id_follows_membership_writes(artifact_store):
+    """Test the member character cache tracks membership writes and removal."""
+    campaign_service = CampaignService(store=artifact_store)
+
+    campaign = await campaign_service.create_campaign(
+        name="Test Campaign",
+        rule_system="shadowdark",
+    )
+    campaign_id = campaign.metadata.id
+    assert campaign_service.cached_character_id(campaign_id, "player-1") is None
+
+    await campaign_service.add_player(campaign_id, "player-1", character_id="char-1")
+    assert campaign_service.cached_character_id(campaign_id, "player-1") == "char-1"
+
+    await campaign_service.update_membership(campaign_id, "player-1", character_id="char-2")
+    assert campaign_service.cached_character_id(campaign_id, "player-1") == "char-2"
+
+    await campaign_service.remove_player(campaign_id, "player-1")
+    assert campaign_service.cached_character_id(campaign_id, "player-1") is None
+
+    # Memberships read through the service are tracked too
+    other_service = CampaignService(store=artifact_store)
+    await other_service.add_player(campaign_id, "player-2", character_id="char-3")
+    await campaign_service.get_membership(campaign_id, "player-2")
+    assert campaign_service.cached_character_id(campaign_id, "player-2") == "char-3"
@@ -0,0 +1,245 @@
+"""Unit tests for DiscordBindingService."""
+
+import asyncio
+
+import pytest
+
+from gm_chatbot.services import discord_binding_service
+from gm_chatbot.services.discord_binding_service import DiscordBindingService
+
+
+@pytest.fixture
+def binding_service(artifact_store):
+    """Create Discord binding service."""
+    return DiscordBindingService(store=artifact_store)
+
+
+class TestBindCampaignToChannel:
+    """Tests for bind_campaign_to_channel."""
+
+    async def test_concurrent_binds_are_applied_together(self, binding_service):
+        """Concurrent binds to different channels all succeed."""
+        bindings = await asyncio.gather(
+            *(
+                binding_service.bind_campaign_to_channel(
+                    campaign_id=f"campaign-{n}",
+                    guild_id="guild-1",
+                    channel_id=f"channel-{n}",
+                    channel_name=f"channel-{n}",
+                    bound_by="player-1",
+                )
+                for n in range(3)
+            )
+        )
+
+        assert [b.channel_id for b in bindings] == ["channel-0", "channel-1", "channel-2"]
+        guild_bindings = await binding_service.list_campaigns_in_guild("guild-1")
+        assert len(guild_bindings) == 3
+
+    async def test_concurrent_conflicting_bind_rejected(self, binding_service):
+        """Only the first of two concurrent binds to one channel succeeds."""
+        results = await asyncio.gather(
+            binding_service.bind_campaign_to_channel(
+                campaign_id="campaign-1",
+                guild_id="guild-1",
+                channel_id="channel-1",
+                channel_name="general",
+                bound_by="player-1",
+            ),
+            binding_service.bind_campaign_to_channel(
+                campaign_id="campaign-2",
+                guild_id="guild-1",
+                channel_id="channel-1",
+                channel_name="general",
+                bound_by="player-1",
+            ),
+            return_exceptions=True,
+        )
+
+        assert results[0].campaign_id == "campaign-1"
+        assert isinstance(results[1], ValueError)
+        assert await binding_service.get_campaign_by_channel("channel-1") == "campaign-1"
+
+    async def test_cancelled_waiter_does_not_break_batch(self, binding_service):
+        """Cancelling one waiter in a batch still resolves the others."""
+        tasks = [
+            asyncio.create_task(
+                binding_service.bind_campaign_to_channel(
+                    campaign_id=f"campaign-{n}",
+                    guild_id="guild-1",
+                    channel_id=f"channel-{n}",
+                    channel_name=f"channel-{n}",
+                    bound_by="player-1",
+                )
+            )
+            for n in range(3)
+        ]
+        await asyncio.sleep(0)
+        # Cancel both the batch leader and a follower while the batch is queued
+        tasks[0].cancel()
+        tasks[1].cancel()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert isinstance(results[1], asyncio.CancelledError)
+        assert results[2].channel_id == "channel-2"
+        guild_bindings = await binding_service.list_campaigns_in_guild("guild-1")
+        assert [b.campaign_id for b in guild_bindings] == ["campaign-2"]
+
+    async def test_rebind_updates_existing_binding(self, binding_service):
+        """Rebinding a campaign moves it to the new channel."""
+        await binding_service.bind_campaign_to_channel(
+            campaign_id="campaign-1",
+            guild_id="guild-1",
+            channel_id="channel-1",
+            channel_name="general",
+            bound_by="player-1",
+        )
+        binding = await binding_service.bind_campaign_to_channel(
+            campaign_id="campaign-1",
+            guild_id="guild-1",
+            channel_id="channel-2",
+            channel_name="tavern",
+            bound_by="player-1",
+        )
+
+        assert binding.channel_id == "channel-2"
+        assert await binding_service.get_campaign_by_channel("channel-1") is None
+
+    async def test_settings_update_keeps_unspecified_values(self, binding_service):
+        """Settings passed on bind only change the keys they contain."""
+        binding = await binding_service.bind_campaign_to_channel(
+            campaign_id="campaign-1",
+            guild_id="guild-1",
+            channel_id="channel-1",
+            channel_name="general",
+            bound_by="player-1",
+            settings={"dice_roll_visibility": "private"},
+        )
+
+        assert binding.settings.dice_roll_visibility == "private"
+        assert binding.settings.allow_spectators is True
+
+    async def test_invalid_settings_rejected(self, binding_service):
+        """Invalid settings fail the bind without writing a binding."""
+        with pytest.raises(ValueError):
+            await binding_service.bind_campaign_to_channel(
+                campaign_id="campaign-1",
+                guild_id="guild-1",
+                channel_id="channel-1",
+                channel_name="general",
+                bound_by="player-1",
+                settings={"dice_roll_visibility": "everyone"},
+            )
+
+        assert await binding_service.get_campaign_by_channel("channel-1") is None
+
+    async def test_unbind_campaign_if_exists(self, binding_service):
+        """Unbinding reports whether a binding was removed."""
+        await binding_service.bind_campaign_to_channel(
+            campaign_id="campaign-1",
+            guild_id="guild-1",
+            channel_id="channel-1",
+            channel_name="general",
+            bound_by="player-1",
+        )
+
+        assert await binding_service.unbind_campaign_if_exists("campaign-1") is True
+        assert await binding_service.unbind_campaign_if_exists("campaign-1") is False
+        assert await binding_service.get_campaign_by_channel("channel-1") is None
+
+    async def test_channel_lookup_cache_invalidated_on_rebind(self, binding_service):
+        """Cached channel lookups follow binds and unbinds."""
+        assert await binding_service.get_campaign_by_channel("channel-1") is None
+
+        await binding_service.bind_campaign_to_channel(
+            campaign_id="campaign-1",
+            guild_id="guild-1",
+            channel_id="channel-1",
+            channel_name="general",
+            bound_by="player-1",
+        )
+        assert await binding_service.get_campaign_by_channel("channel-1") == "campaign-1"
+
+        await binding_service.bind_campaign_to_channel(
+            campaign_id="campaign-1",
+            guild_id="guild-1",
+            channel_id="channel-2",
+            channel_name="tavern",
+            bound_by="player-1",
+        )
+        assert await binding_service.get_campaign_by_channel("channel-1") is None
+        assert await binding_service.get_campaign_by_channel("channel-2") == "campaign-1"
+
+        await binding_service.unbind_campaign("campaign-1")
+        assert await binding_service.get_campaign_by_channel("channel-2") is None
+
+    async def test_channel_lookup_sees_changes_from_other_instances(self, artifact_store):
+        """Cached lookups revalidate against binding files written elsewhere."""
+        reader = DiscordBindingService(store=artifact_store)
+        writer = DiscordBindingService(store=artifact_store)
+
+        # A miss is not cached, so a later bind is seen immediately
+        assert await reader.get_campaign_by_channel("channel-1") is None
+        await writer.bind_campaign_to_channel(
+            campaign_id="campaign-1",
+            guild_id="guild-1",
+            channel_id="channel-1",
+            channel_name="general",
+            bound_by="player-1",
+        )
+        assert await reader.get_campaign_by_channel("channel-1") == "campaign-1"
+
+        await writer.bind_campaign_to_channel(
+            campaign_id="campaign-1",
+            guild_id="guild-1",
+            channel_id="channel-2",
+            channel_name="tavern",
+            bound_by="player-1",
+        )
+        assert await reader.get_campaign_by_channel("channel-1") is None
+
+        assert await reader.get_campaign_by_channel("channel-2") == "campaign-1"
+        await writer.unbind_campaign("campaign-1")
+        assert await reader.get_campaign_by_channel("channel-2") is None
+
+    async def test_channel_lookup_cache_evicts_least_recently_used(
+        self, binding_service, monkeypatch
+    ):
+        """A recently hit channel survives eviction when the cache fills."""
+        monkeypatch.setattr(discord_binding_service, "CHANNEL_CACHE_MAXSIZE", 2)
+        for n in range(3):
+            await binding_service.bind_campaign_to_channel(
+                campaign_id=f"campaign-{n}",
+                guild_id="guild-1",
+                channel_id=f"channel-{n}",
+                channel_name="general",
+                bound_by="player-1",
+            )
+
+        await binding_service.get_campaign_by_channel("channel-0")
+        await binding_service.get_campaign_by_channel("channel-1")
+        await binding_service.get_campaign_by_channel("channel-0")
+        await binding_service.get_campaign_by_channel("channel-2")
+
+        assert list(binding_service._channel_cache) == ["channel-0", "channel-2"]
+
+    async def test_list_campaigns_in_guild(self, binding_service):
+        """Only bindings in the requested guild are listed."""
+        for campaign_id, guild_id, channel_id in [
+            ("campaign-1", "guild-1", "channel-1"),
+            ("campaign-2", "guild-1", "channel-2"),
+            ("campaign-3", "guild-2", "channel-3"),
+        ]:
+            await binding_service.bind_campaign_to_channel(
+                campaign_id=campaign_id,
+                guild_id=guild_id,
+                channel_id=channel_id,
+                channel_name="general",
+                bound_by="player-1",
+            )
+
+        bindings = await binding_service.list_campaigns_in_guild("guild-1")
+
+        assert sorted(binding.campaign_id for binding in bindings) == ["campaign-1", "campaign-2"]
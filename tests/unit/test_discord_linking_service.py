@@ -0,0 +1,84 @@
+"""Unit tests for DiscordLinkingService."""
+
+import pytest
+
+from gm_chatbot.services.discord_linking_service import DiscordLinkingService
+
+
+@pytest.fixture
+def linking_service(artifact_store):
+    """Create Discord linking service."""
+    return DiscordLinkingService(store=artifact_store)
+
+
+class TestAutoLinkPlayer:
+    """Tests for auto_link_player."""
+
+    async def test_new_user_gets_player(self, linking_service):
+        """A new Discord user is linked to a freshly created player."""
+        player = await linking_service.auto_link_player(
+            discord_user_id="1234",
+            discord_username="tester",
+            guild_id="guild-1",
+            guild_name="Test Guild",
+        )
+
+        assert player.display_name == "tester"
+        linked = await linking_service.get_player_by_discord_id("1234")
+        assert linked is not None
+        assert linked.metadata.id == player.metadata.id
+
+    async def test_existing_link_returns_same_player(self, linking_service):
+        """Linking an already linked user returns the existing player."""
+        first = await linking_service.auto_link_player(
+            discord_user_id="1234",
+            discord_username="tester",
+        )
+        second = await linking_service.auto_link_player(
+            discord_user_id="1234",
+            discord_username="renamed",
+        )
+
+        assert second.metadata.id == first.metadata.id
+
+
+class TestGetPlayerByDiscordId:
+    """Tests for get_player_by_discord_id."""
+
+    async def test_cached_lookup_skips_link_scan(self, linking_service, monkeypatch):
+        """A linked user resolves without rescanning every link."""
+        player = await linking_service.auto_link_player(
+            discord_user_id="1234",
+            discord_username="tester",
+        )
+
+        async def fail_scan(*args, **kwargs):
+            raise AssertionError("link scan should be skipped")
+
+        monkeypatch.setattr(linking_service, "get_discord_link_by_user_id", fail_scan)
+
+        resolved = await linking_service.get_player_by_discord_id("1234")
+        assert resolved is not None
+        assert resolved.metadata.id == player.metadata.id
+
+    async def test_unlink_clears_cached_lookup(self, linking_service):
+        """Unlinked users no longer resolve to their old player."""
+        await linking_service.auto_link_player(
+            discord_user_id="1234",
+            discord_username="tester",
+        )
+
+        await linking_service.unlink_discord_user("1234")
+
+        assert await linking_service.get_player_by_discord_id("1234") is None
+
+
+class TestEnsurePlayer:
+    """Tests for ensure_player."""
+
+    async def test_creates_then_reuses_player(self, linking_service):
+        """The first call links a new player; later calls return it."""
+        created = await linking_service.ensure_player("1234", "tester", "guild-1", "Test Guild")
+        resolved = await linking_service.ensure_player("1234", "tester", "guild-1", "Test Guild")
+
+        assert resolved.metadata.id == created.metadata.id
@@ -0,0 +1,110 @@
+"""Unit tests for the Discord RateLimiter."""
+
+import asyncio
+
+import pytest
+
+from gm_chatbot.discord.utils import rate_limiter
+from gm_chatbot.discord.utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Controllable stand-in for the time module."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Patch the rate limiter's clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter checks."""
+
+    def test_allows_up_to_limit(self, clock):
+        """Requests within the limit pass and the next one is rejected."""
+        limiter = RateLimiter(commands_per_user=(3, 60))
+
+        assert [limiter.check_user_command("user-1") for _ in range(3)] == [True] * 3
+        assert limiter.check_user_command("user-1") is False
+
+    def test_keys_are_independent(self, clock):
+        """Exhausting one key does not limit another."""
+        limiter = RateLimiter(messages_per_channel=(1, 60))
+
+        assert limiter.check_channel_message("channel-1") is True
+        assert limiter.check_channel_message("channel-1") is False
+        assert limiter.check_channel_message("channel-2") is True
+
+    def test_window_expiry_allows_again(self, clock):
+        """Requests are allowed again once the window has passed."""
+        limiter = RateLimiter(api_calls_per_guild=(2, 60))
+
+        assert limiter.check_guild_api_call("guild-1") is True
+        assert limiter.check_guild_api_call("guild-1") is True
+        assert limiter.check_guild_api_call("guild-1") is False
+
+        clock.now += 120
+        assert limiter.check_guild_api_call("guild-1") is True
+
+    def test_refills_one_request_per_interval(self, clock):
+        """After a burst, requests are admitted again at the steady rate."""
+        limiter = RateLimiter(commands_per_user=(4, 60))
+        for _ in range(4):
+            assert limiter.check_user_command("user-1") is True
+        assert limiter.check_user_command("user-1") is False
+
+        # One emission interval (60 / 4 = 15s) frees exactly one slot
+        clock.now += 15
+        assert limiter.check_user_command("user-1") is True
+        assert limiter.check_user_command("user-1") is False
+
+    def test_tracked_keys_are_bounded(self, clock):
+        """Least recently used keys are dropped beyond max_keys."""
+        limiter = RateLimiter(commands_per_user=(1, 60), max_keys=2)
+
+        for user_id in ("user-1", "user-2", "user-3"):
+            assert limiter.check_user_command(user_id) is True
+
+        assert list(limiter.user_commands) == ["user-2", "user-3"]
+
+    async def test_concurrent_checks_respect_limit(self, clock):
+        """Concurrent coroutines cannot push a key past its limit."""
+        limiter = RateLimiter(commands_per_user=(3, 60))
+
+        async def attempt() -> bool:
+            await asyncio.sleep(0)
+            return limiter.check_user_command("user-1")
+
+        results = await asyncio.gather(*(attempt() for _ in range(10)))
+        assert results.count(True) == 3
+
+    def test_shared_now_is_used(self, clock):
+        """A caller-supplied timestamp is used instead of reading the clock."""
+        limiter = RateLimiter(commands_per_user=(1, 60))
+
+        assert limiter.check_user_command("user-1", now=5000.0) is True
+        assert limiter.check_user_command("user-1", now=5030.0) is False
+        assert limiter.check_user_command("user-1", now=5060.0) is True
+
+    def test_full_burst_at_non_round_time(self, clock):
+        """A limit that doesn't divide the window still admits exactly the limit."""
+        limiter = RateLimiter(commands_per_user=(7, 10), api_calls_per_guild=(100, 60))
+        now = 123456.789012345
+
+        commands = [limiter.check_user_command("user-1", now=now) for _ in range(8)]
+        api_calls = [limiter.check_guild_api_call("guild-1", now=now) for _ in range(101)]
+
+        assert commands == [True] * 7 + [False]
+        assert api_calls == [True] * 100 + [False]
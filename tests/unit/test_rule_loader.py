@@ -0,0 +1,56 @@
+"""Unit tests for RuleLoader."""
+
+import pytest
+
+from gm_chatbot.rules.loader import RuleLoader
+
+RULES_YAML = """
+metadata:
+  system_name: {name}
+  version: "1.0"
+"""
+
+
+def write_system(rules_dir, system, name="Test System"):
+    """Write a minimal rule file for a system."""
+    system_dir = rules_dir / system
+    system_dir.mkdir(exist_ok=True)
+    (system_dir / "core.yaml").write_text(RULES_YAML.format(name=name))
+
+
+class TestLoadRules:
+    """Tests for load_rules caching."""
+
+    def test_unchanged_file_served_from_cache(self, tmp_path):
+        """Loading an unchanged rule file twice returns the cached rule set."""
+        write_system(tmp_path, "testsys")
+        loader = RuleLoader(tmp_path)
+
+        assert loader.load_rules("testsys") is loader.load_rules("testsys")
+
+    def test_edited_file_reloaded(self, tmp_path):
+        """Editing a rule file makes the next load see the new contents."""
+        write_system(tmp_path, "testsys")
+        loader = RuleLoader(tmp_path)
+        loader.load_rules("testsys")
+
+        write_system(tmp_path, "testsys", name="Edited Test System")
+
+        assert loader.load_rules("testsys").metadata.system_name == "Edited Test System"
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        """The least recently used rule set is evicted beyond the limit."""
+        monkeypatch.setattr(RuleLoader, "CACHE_MAXSIZE", 2)
+        for system in ("one", "two", "three"):
+            write_system(tmp_path, system)
+        loader = RuleLoader(tmp_path)
+
+        for system in ("one", "two", "three"):
+            loader.load_rules(system)
+
+        assert list(loader._cache) == ["two:latest", "three:latest"]
+
+    def test_missing_system(self, tmp_path):
+        """Loading an unknown system raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            RuleLoader(tmp_path).load_rules("missing")
@@ -0,0 +1,92 @@
+"""Unit tests for RulesEngine."""
+
+import pytest
+
+from gm_chatbot.rules.engine import RulesEngine
+
+RULES_YAML = """
+metadata:
+  system_name: Test System
+  version: "1.0"
+abilities:
+  - name: strength
+    abbreviation: STR
+  - name: dexterity
+    abbreviation: DEX
+ability_modifiers:
+  range_mapping:
+    - range: [1, 9]
+      modifier: -1
+    - range: [10, 11]
+      modifier: 0
+    - range: [12, 18]
+      modifier: 1
+difficulty_classes:
+  Easy: 9
+  normal: 12
+dice_expressions:
+  ability_check: 1d20
+"""
+
+
+@pytest.fixture
+def rules_engine(tmp_path):
+    """Create a rules engine with a small test system loaded."""
+    system_dir = tmp_path / "testsys"
+    system_dir.mkdir()
+    (system_dir / "core.yaml").write_text(RULES_YAML)
+    engine = RulesEngine(tmp_path)
+    engine.load_system("testsys")
+    return engine
+
+
+class TestGetAbilityDefinition:
+    """Tests for get_ability_definition."""
+
+    def test_lookup_by_name_or_abbreviation(self, rules_engine):
+        """Abilities are found by name or abbreviation, case-insensitively."""
+        by_name = rules_engine.get_ability_definition("Strength")
+        by_abbreviation = rules_engine.get_ability_definition("str")
+
+        assert by_name is not None
+        assert by_name.abbreviation == "STR"
+        assert by_abbreviation is by_name
+
+    def test_unknown_ability(self, rules_engine):
+        """Unknown abilities return None."""
+        assert rules_engine.get_ability_definition("luck") is None
+
+    def test_no_system_loaded(self, tmp_path):
+        """Lookups before any system is loaded return None."""
+        assert RulesEngine(tmp_path).get_ability_definition("strength") is None
+
+
+class TestGetAbilityModifier:
+    """Tests for get_ability_modifier."""
+
+    @pytest.mark.parametrize(
+        ("score", "modifier"),
+        [(1, -1), (9, -1), (10, 0), (11, 0), (12, 1), (18, 1)],
+    )
+    def test_scores_map_to_range_modifier(self, rules_engine, score, modifier):
+        """Scores inside a range get that range's modifier."""
+        assert rules_engine.get_ability_modifier(score) == modifier
+
+    def test_score_outside_ranges(self, rules_engine):
+        """Scores outside every range have no modifier."""
+        assert rules_engine.get_ability_modifier(25) == 0
+
+
+class TestNamedLookups:
+    """Tests for difficulty class and dice expression lookups."""
+
+    def test_difficulty_class_ignores_case(self, rules_engine):
+        """Difficulty classes match regardless of case in the file or query."""
+        assert rules_engine.get_difficulty_class("easy") == 9
+        assert rules_engine.get_difficulty_class("NORMAL") == 12
+        assert rules_engine.get_difficulty_class("hard") is None
+
+    def test_dice_expression_ignores_case(self, rules_engine):
+        """Dice expressions match regardless of query case."""
+        assert rules_engine.get_dice_expression("Ability_Check") == "1d20"
+        assert rules_engine.get_dice_expression("damage") is None